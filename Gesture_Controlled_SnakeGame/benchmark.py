@@ -0,0 +1,96 @@
+# benchmark.py
+# Frame-time benchmark for the snake at different body lengths (runs headless).
+#
+#   python benchmark.py                       # lengths 100, 500, 1000, 2500, 5000
+#   python benchmark.py --lengths 100 5000 --frames 100
+#
+# For each length it times Snake.update + collides_self and Snake.draw, and the
+# old per-point drawing (a new SRCALPHA glow surface and a draw.circle per point)
+# as a baseline, on a screen-sized surface.
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.snake import Snake, catmull_rom_chain
+
+WIDTH, HEIGHT = 800, 600
+
+
+def draw_unbatched(snake, surface):
+    """The drawing loop Snake.draw used before glow sprites were cached and batched."""
+    if len(snake.body_points) < 2:
+        return
+    smooth = catmull_rom_chain(snake.body_points, count=10)
+    radius = snake.radius
+    glow_radius = int(radius * 2.3)
+    for x, y in smooth:
+        glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surface, (200, 200, 255, 45), (glow_radius, glow_radius), glow_radius)
+        surface.blit(glow_surface, (x - glow_radius, y - glow_radius))
+        pygame.draw.circle(surface, (230, 230, 255), (int(x), int(y)), radius)
+
+
+def build_snake(points):
+    """A snake of `points` body points, laid out as a serpentine that stays on screen (up to ~8000)."""
+    margin = 20
+    snake = Snake(start_pos=(margin, margin))
+    snake.target_length = points * snake.speed
+    row_steps = (WIDTH - 2 * margin) // snake.speed
+    direction = (1, 0)
+    step = 0
+    while len(snake.body_points) < points:
+        # run along a row, then drop 12 px and come back
+        if direction[1] == 0 and step >= row_steps:
+            direction, step = (0, 1), 0
+        elif direction[1] == 1 and step >= 3:
+            row = (snake.head[1] - margin) // 12
+            direction, step = ((1, 0) if row % 2 == 0 else (-1, 0)), 0
+        snake.set_direction(direction)
+        snake.update()
+        step += 1
+    return snake
+
+
+def _per_frame(fn, frames):
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t0) / frames * 1000.0
+
+
+def bench_frames(lengths, frames):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    print(f"frames={frames} (ms per frame; 33.3 ms is the 30 FPS budget)")
+    print(f"{'points':>7} {'update':>8} {'draw old':>9} {'draw new':>9} {'speedup':>8} {'frame':>8}")
+    for points in lengths:
+        snake = build_snake(points)
+
+        def step():
+            snake.update()
+            snake.collides_self()
+
+        t_update = _per_frame(step, frames)
+        t_old = _per_frame(lambda: draw_unbatched(snake, screen), frames)
+        t_new = _per_frame(lambda: snake.draw(screen), frames)
+        print(f"{len(snake.body_points):>7} {t_update:>8.3f} {t_old:>9.2f} {t_new:>9.2f} "
+              f"{t_old / t_new:>7.1f}x {t_update + t_new:>8.2f}")
+    pygame.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake frame-time benchmark")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 500, 1000, 2500, 5000],
+                        help="body lengths in points")
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+    bench_frames(args.lengths, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,53 @@
 
 import pygame
 import math
+from collections import deque
+
+from game.spatial_grid import SpatialGrid
+
+# cell size of the body index; a bit over the self-collision distance
+GRID_CELL = 16
+
+# arc lengths are differences of running sums, so a tail that should end exactly
+# on a point can miss it by rounding error; closer than this counts as on it
+ARC_EPS = 1e-9
+
+GLOW_COLOR = (200, 200, 255, 45)
+BODY_COLOR = (230, 230, 255)
+
+# pre-rendered circle sprites, keyed by (radius, color); shared by every Snake
+_sprites = {}
+
+
+def circle_sprite(radius, color):
+    """A radius-`radius` filled circle on a transparent surface, rendered once per radius/colour."""
+    key = (radius, color)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _sprites[key] = sprite
+    return sprite
+
+
+def catmull_rom_segment(p0, p1, p2, p3, count=12):
+    """`count` points of the Catmull-Rom curve from p1 towards p2 (p2 itself excluded)."""
+    pts = []
+    for t_step in range(count):
+        t = t_step / float(count)
+        t2 = t * t
+        t3 = t2 * t
+        x = 0.5 * ((2*p1[0]) +
+                   (-p0[0] + p2[0]) * t +
+                   (2*p0[0] - 5*p1[0] + 4*p2[0] - p3[0]) * t2 +
+                   (-p0[0] + 3*p1[0] - 3*p2[0] + p3[0]) * t3)
+        y = 0.5 * ((2*p1[1]) +
+                   (-p0[1] + p2[1]) * t +
+                   (2*p0[1] - 5*p1[1] + 4*p2[1] - p3[1]) * t2 +
+                   (-p0[1] + 3*p1[1] - 3*p2[1] + p3[1]) * t3)
+        pts.append((x, y))
+    return pts
+
 
 def catmull_rom_chain(points, count=12):
     if len(points) < 2:
@@ -10,20 +57,7 @@ def catmull_rom_chain(points, count=12):
     pts = []
     ext = [points[0]] + points + [points[-1]]
     for i in range(len(ext)-3):
-        p0, p1, p2, p3 = ext[i], ext[i+1], ext[i+2], ext[i+3]
-        for t_step in range(count):
-            t = t_step / float(count)
-            t2 = t * t
-            t3 = t2 * t
-            x = 0.5 * ((2*p1[0]) +
-                       (-p0[0] + p2[0]) * t +
-                       (2*p0[0] - 5*p1[0] + 4*p2[0] - p3[0]) * t2 +
-                       (-p0[0] + 3*p1[0] - 3*p2[0] + p3[0]) * t3)
-            y = 0.5 * ((2*p1[1]) +
-                       (-p0[1] + p2[1]) * t +
-                       (2*p0[1] - 5*p1[1] + 4*p2[1] - p3[1]) * t2 +
-                       (-p0[1] + 3*p1[1] - 3*p2[1] + p3[1]) * t3)
-            pts.append((x, y))
+        pts.extend(catmull_rom_segment(ext[i], ext[i+1], ext[i+2], ext[i+3], count))
     pts.append(points[-1])
     return pts
 
@@ -34,7 +68,21 @@ class Snake:
         self.speed = speed
         self.segment_length = segment_length
 
-        self.body_points = [start_pos]
+        # Body polyline, head first, in a deque: the head is added and the tail trimmed
+        # in amortized O(1). Each point also stores its arc-length coordinate (how far
+        # the head had travelled when it was laid down), so segment and body lengths
+        # are differences and the path never has to be re-walked.
+        self._points = deque([tuple(start_pos)])
+        self._arc = deque([0.0])
+        # Spatial index of the body points, keyed by a serial number that increases
+        # from tail to head (head is _head_seq), so a point's distance from the head
+        # in points is _head_seq - seq.
+        self._grid = SpatialGrid(GRID_CELL)
+        self._head_seq = 0
+        self._grid.insert(0, self._points[0])
+        # draw(): blit lists of the stable body segments, keyed by point serial number
+        self._blit_cache = {}
+        self._blit_radius = None
         # total length in pixels the snake should occupy
         self.target_length = segment_length * 5
         self.head_pos = list(start_pos)
@@ -43,6 +91,20 @@ class Snake:
 
         self.radius = 3   # constant thickness → slender snake
 
+    @property
+    def body_points(self):
+        """Body polyline as a list of (x, y), head first (O(n) copy; use `head` for the head)."""
+        return list(self._points)
+
+    @property
+    def head(self):
+        return self._points[0]
+
+    @property
+    def length(self):
+        """Current path length in pixels (reaches target_length once fully grown)."""
+        return self._arc[0] - self._arc[-1]
+
     def set_direction(self, dvec):
         self.direction = dvec
 
@@ -60,76 +122,117 @@ class Snake:
         self.head_pos[1] += dy
 
         # insert new head point
-        self.body_points.insert(0, (self.head_pos[0], self.head_pos[1]))
+        hx, hy = self._points[0]
+        self._arc.appendleft(self._arc[0] + math.hypot(self.head_pos[0] - hx, self.head_pos[1] - hy))
+        self._points.appendleft((self.head_pos[0], self.head_pos[1]))
+        self._head_seq += 1
+        self._grid.insert(self._head_seq, self._points[0])
+
+        self._trim_tail()
 
-        # Rebuild the body_points so that the total path length equals target_length.
+    def _trim_tail(self):
+        # Trim the tail so that the total path length equals target_length.
         # If the current path is shorter than target_length we keep the entire path (i.e. snake grows).
-        new_points = [self.body_points[0]]
-        accumulated = 0.0
-
-        for i in range(len(self.body_points) - 1):
-            x1, y1 = self.body_points[i]
-            x2, y2 = self.body_points[i + 1]
-            seg = math.hypot(x2 - x1, y2 - y1)
-
-            # if adding whole segment doesn't exceed target, keep p2
-            if accumulated + seg <= self.target_length:
-                new_points.append((x2, y2))
-                accumulated += seg
-            else:
-                # need partial segment to exactly reach target_length
-                remain = self.target_length - accumulated
-                if seg > 0 and remain > 0:
-                    ratio = remain / seg
-                    nx = x1 + (x2 - x1) * ratio
-                    ny = y1 + (y2 - y1) * ratio
-                    new_points.append((nx, ny))
-                # reached target length — stop adding further tail points
-                break
-
-        # If accumulated < target_length and we've appended all original points,
-        # that's fine: snake is still "growing" until it reaches target_length.
-        self.body_points = new_points
+        points, arc, grid = self._points, self._arc, self._grid
+        end = arc[0] - self.target_length  # arc coordinate where the body must end
+        if arc[-1] >= end - ARC_EPS:
+            return
+
+        tail_seq = self._head_seq - len(points) + 1
+        # drop tail points whose whole segment lies past the end
+        while arc[-2] < end - ARC_EPS:
+            grid.remove(tail_seq, points.pop())
+            arc.pop()
+            self._blit_cache.pop(tail_seq, None)
+            tail_seq += 1
+
+        # need partial segment to exactly reach target_length
+        remain = arc[-2] - end
+        if remain > ARC_EPS:
+            x1, y1 = points[-2]
+            x2, y2 = points[-1]
+            ratio = remain / (arc[-2] - arc[-1])
+            points[-1] = (x1 + (x2 - x1) * ratio, y1 + (y2 - y1) * ratio)
+            arc[-1] = end
+            grid.move(tail_seq, (x2, y2), points[-1])
+        else:
+            # the previous point sits exactly at target_length
+            grid.remove(tail_seq, points.pop())
+            arc.pop()
+            self._blit_cache.pop(tail_seq, None)
 
     def draw(self, surface):
-        if len(self.body_points) < 2:
+        if len(self._points) < 2:
             return
 
-        smooth = catmull_rom_chain(self.body_points, count=10)
-
         # --- CONSTANT WIDTH SNAKE (slender) ---
         radius = self.radius
         glow_radius = int(radius * 2.3)
 
-        for i, (x, y) in enumerate(smooth):
-            # glowing outer layer
-            glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (200, 200, 255, 45), (glow_radius, glow_radius), glow_radius)
-            surface.blit(glow_surface, (x - glow_radius, y - glow_radius))
-
-            
-            body_color = (230, 230, 255)
-            pygame.draw.circle(surface, body_color, (int(x), int(y)), radius)
+        # glowing outer layer + body for each smoothed point, from cached sprites in
+        # one blits() call; the interleaved order matches drawing them one by one
+        glow = circle_sprite(glow_radius, GLOW_COLOR)
+        body = circle_sprite(radius, BODY_COLOR)
+        if self._blit_radius != radius:
+            self._blit_cache.clear()
+            self._blit_radius = radius
+
+        def blits_for(smooth):
+            return [item for x, y in smooth
+                    for item in ((glow, (x - glow_radius, y - glow_radius)),
+                                 (body, (int(x) - radius, int(y) - radius)))]
+
+        # Same curve as catmull_rom_chain(body_points, count=10), built per segment.
+        # Segment i runs from point i to i+1 and depends on points i-1..i+2. Away from
+        # both ends those never move, so its blits are cached under point i's serial
+        # number; only the few segments at the head and the trimmed tail are redone.
+        points = self.body_points
+        n = len(points)
+        cache = self._blit_cache
+        batch = []
+        for i in range(n - 1):
+            stable = 0 < i < n - 3
+            seq = self._head_seq - i
+            items = cache.get(seq) if stable else None
+            if items is None:
+                p0 = points[i-1] if i else points[0]
+                p3 = points[i+2] if i + 2 < n else points[-1]
+                items = blits_for(catmull_rom_segment(p0, points[i], points[i+1], p3, count=10))
+                if stable:
+                    cache[seq] = items
+            batch.extend(items)
+        batch.extend(blits_for(points[-1:]))
+        surface.blits(batch, doreturn=False)
 
     def head_rect(self, size=12):
-        x, y = self.body_points[0]
+        x, y = self._points[0]
         return pygame.Rect(int(x - size/2), int(y - size/2), size, size)
 
     def collides_with_point(self, point, radius=10):
         px, py = point
-        hx, hy = self.body_points[0]
+        hx, hy = self._points[0]
         return (hx - px)**2 + (hy - py)**2 <= radius*radius
 
+    def touching(self, grid, radius=10):
+        """Keys of the items in `grid` (a SpatialGrid of pickups/obstacles) within `radius` of the head."""
+        hx, hy = self._points[0]
+        r2 = radius * radius
+        return [key for key, (px, py) in grid.nearby((hx, hy), radius)
+                if (hx - px)**2 + (hy - py)**2 <= r2]
+
     def collides_self(self):
         # require a minimum number of points before self-collision checking
-        if len(self.body_points) < 8:
+        if len(self._points) < 8:
             return False
 
-        hx, hy = self.body_points[0]
+        hx, hy = self._points[0]
         # start checking a bit into the body to avoid immediate neighbor collisions (false positives)
         # use a distance threshold based on radius (a little buffer)
-        thresh = (self.radius * 1.8) ** 2
-        for p in self.body_points[8:]:
-            if (hx - p[0])**2 + (hy - p[1])**2 < thresh:
+        # only the grid cells around the head are looked at, so the cost does not grow with length
+        dist = self.radius * 1.8
+        thresh = dist ** 2
+        newest = self._head_seq - 8  # skip the 8 points nearest the head
+        for seq, (px, py) in self._grid.nearby((hx, hy), dist):
+            if seq <= newest and (hx - px)**2 + (hy - py)**2 < thresh:
                 return True
         return False
\ No newline at end of file
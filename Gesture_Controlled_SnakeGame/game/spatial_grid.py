@@ -0,0 +1,49 @@
+# game/spatial_grid.py
+# Uniform-grid spatial hash: items are bucketed by cell, so a proximity query only
+# looks at the cells around the query point instead of every item.
+# Used for the snake's own body points and for pickups (food, future obstacles).
+
+class SpatialGrid:
+    def __init__(self, cell_size=16):
+        self.cell_size = cell_size
+        self._cells = {}  # (cx, cy) -> {key: (x, y)}
+
+    def _cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, key, pos):
+        self._cells.setdefault(self._cell(*pos), {})[key] = pos
+
+    def remove(self, key, pos):
+        """Remove `key`, which must have been inserted (or last moved) at `pos`."""
+        cell = self._cell(*pos)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def move(self, key, old, new):
+        cell = self._cell(*new)
+        if cell == self._cell(*old):
+            self._cells[cell][key] = new
+        else:
+            self.remove(key, old)
+            self.insert(key, new)
+
+    def clear(self):
+        self._cells.clear()
+
+    def nearby(self, pos, radius):
+        """
+        Yield (key, (x, y)) for items in the cells overlapping the square of half-size
+        `radius` around `pos`. This is a superset: callers apply the exact distance test.
+        """
+        x, y = pos
+        cs = self.cell_size
+        cells = self._cells
+        for cx in range(int((x - radius) // cs), int((x + radius) // cs) + 1):
+            for cy in range(int((y - radius) // cs), int((y + radius) // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket.items()
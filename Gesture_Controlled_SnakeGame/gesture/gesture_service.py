@@ -0,0 +1,57 @@
+import cv2
+
+from gesture.gesture_model import GestureClassifier
+from gesture.gesture_worker import GestureSample, GestureWorker
+
+
+def open_camera(cam_index: int = 0):
+    """Open the capture device, preferring DirectShow on Windows where available."""
+    try:
+        cap = cv2.VideoCapture(cam_index, cv2.CAP_DSHOW)
+        if not cap.isOpened():
+            cap.release()
+            cap = cv2.VideoCapture(cam_index)
+    except Exception:
+        cap = cv2.VideoCapture(cam_index)
+    return cap
+
+
+class GestureService:
+    """
+    The one owner of the webcam and the MediaPipe graph.
+
+    The home screen and the gameplay loop both read from the same service: latest()
+    returns the newest GestureSample (prediction, processed frame, landmarks, bbox)
+    published by a single GestureWorker, so the camera is opened once and only one
+    Hands graph is loaded.
+    """
+
+    def __init__(self, cam_index: int = 0, interval: float = 0.12, target_size: int = 320,
+                 verbose: bool = False):
+        self.cap = open_camera(cam_index)
+        self.classifier = GestureClassifier(verbose=verbose, target_size=target_size)
+        self.worker = GestureWorker(self.cap, self.classifier, interval=interval)
+
+    @property
+    def target_size(self) -> int:
+        return self.classifier.target_size
+
+    def is_opened(self) -> bool:
+        return bool(self.cap and self.cap.isOpened())
+
+    def start(self) -> "GestureService":
+        self.worker.start()
+        return self
+
+    def latest(self) -> GestureSample:
+        return self.worker.latest()
+
+    def close(self):
+        # stop the worker before releasing the camera it reads from
+        self.worker.stop()
+        if self.cap:
+            self.cap.release()
+        try:
+            self.classifier.close()
+        except Exception:
+            pass
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class GestureSample(NamedTuple):
+    """One published prediction plus the detection artifacts the UI draws."""
+    action: Optional[str]
+    conf: float
+    timestamp: float  # time.time() of the prediction, 0.0 before the first one
+    frame: Optional[np.ndarray] = None  # mirrored, cropped BGR frame given to MediaPipe
+    landmarks: Optional[List[Tuple[float, float, float]]] = None
+    bbox: Optional[Tuple[int, int, int, int]] = None
+
+
+class GestureWorker:
+    """
+    Runs camera capture + GestureClassifier.predict on a background thread so the
+    game loop never waits on cap.read() or MediaPipe inference.
+
+    The newest prediction is kept in a single latest-value slot: the worker replaces
+    the GestureSample, readers call latest() and get whatever is there without locking
+    (rebinding one attribute is atomic). Older predictions are simply overwritten.
+    """
+
+    def __init__(self, cap, classifier, interval: float = 0.18):
+        self.cap = cap
+        self.classifier = classifier
+        self.interval = interval  # minimum seconds between predictions
+        self._latest = GestureSample(None, 0.0, 0.0)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gesture-worker", daemon=True)
+
+    def start(self) -> "GestureWorker":
+        self._thread.start()
+        return self
+
+    def latest(self) -> GestureSample:
+        """Most recent sample; its timestamp is 0.0 until the first prediction."""
+        return self._latest
+
+    def _run(self):
+        classifier = self.classifier
+        while not self._stop.is_set():
+            started = time.time()
+            ret, frame = self.cap.read()
+            if ret:
+                try:
+                    action, conf = classifier.predict(frame)
+                    # predict() rebinds these on every call, so handing them out is safe
+                    self._latest = GestureSample(action, conf, time.time(),
+                                                 classifier.last_frame_processed,
+                                                 classifier.last_landmarks,
+                                                 classifier.last_bbox)
+                except Exception:
+                    # model inference may error — keep the worker alive
+                    pass
+            # wait out the rest of the interval, waking at once on stop()
+            self._stop.wait(max(0.0, self.interval - (time.time() - started)))
+
+    def stop(self, timeout: float = 1.0):
+        """Signal the thread and wait for it, so the capture can be released safely."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
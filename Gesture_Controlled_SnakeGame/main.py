@@ -1,12 +1,11 @@
 import pygame
 import sys
-import cv2
 import random
-import time
 
-from gesture.gesture_model import GestureClassifier
+from gesture.gesture_service import GestureService
 from controller.input_controller import InputController
 from game.snake import Snake
+from game.spatial_grid import SpatialGrid
 from game.background import Background
 from game.player import Player
 from ui import HomeScreen
@@ -29,6 +28,16 @@ def spawn_food(margin=40):
     y = random.randint(margin, HEIGHT - margin)
     return (x, y)
 
+def place_food(pickups, old=None):
+    # pickups is the spatial index of everything the head can run into (food now,
+    # obstacles later); the snake queries it with snake.touching(). Only the old
+    # food is taken out, anything else stored there stays.
+    if old is not None:
+        pickups.remove("food", old)
+    food = spawn_food()
+    pickups.insert("food", food)
+    return food
+
 def main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Gesture Snake")
@@ -40,20 +49,21 @@ def main():
     snake = Snake(start_pos=(WIDTH//2, HEIGHT//2))
     controller = InputController(initial="RIGHT")
 
-    # Gesture classifier and webcam
-    cap = cv2.VideoCapture(0)
-    classifier = GestureClassifier(verbose=False)
+    # One gesture service (webcam + classifier) shared by the home screen and gameplay;
+    # capture + inference run on a worker thread and the loop only picks up the newest
+    # prediction. Throttled so inference doesn't run every frame.
+    gesture_interval = 0.12  # seconds
+    gestures = GestureService(cam_index=0, interval=gesture_interval).start()
     last_gesture = None
     last_conf = 0.0
-    # throttle gesture inference (don't run every frame)
-    gesture_interval = 0.18  # seconds
     last_gesture_time = 0.0
 
     # Home screen
-    home = HomeScreen(screen, cam_index=0, show_camera_preview=True)
+    home = HomeScreen(screen, gestures, show_camera_preview=True)
     in_home = True
 
-    food = spawn_food()
+    pickups = SpatialGrid(cell_size=32)
+    food = place_food(pickups)
     food_radius = 8
 
     player.start()
@@ -75,7 +85,7 @@ def main():
                             player.start()
                             snake = Snake(start_pos=(WIDTH//2, HEIGHT//2))
                             controller = InputController(initial="RIGHT")
-                            food = spawn_food()
+                            food = place_food(pickups, food)
                             game_over = False
                         else:
                             # Otherwise run a short blocking check to confirm camera can see gestures
@@ -88,7 +98,7 @@ def main():
                                 player.start()
                                 snake = Snake(start_pos=(WIDTH//2, HEIGHT//2))
                                 controller = InputController(initial="RIGHT")
-                                food = spawn_food()
+                                food = place_food(pickups, food)
                                 game_over = False
                             else:
                                 print("[main] Could not detect gestures reliably. Please adjust camera/lighting and try again.")
@@ -107,7 +117,7 @@ def main():
                         player.start()
                         snake = Snake(start_pos=(WIDTH//2, HEIGHT//2))
                         controller = InputController(initial="RIGHT")
-                        food = spawn_food()
+                        food = place_food(pickups, food)
                         game_over = False
 
 # Also, in the home-screen loop (when in_home), ensure the UI keeps updating:
@@ -115,43 +125,16 @@ def main():
             home.draw()  # this will internally call update_ready_status periodically
             pygame.display.flip()
             continue
-            if time.time() - last_gesture_time > gesture_interval:
-                ret, frame = cap.read()
-                if ret:
-                    try:
-                        action, conf = classifier.predict(frame)
-                        last_gesture = action
-                        last_conf = conf
-                        last_gesture_time = time.time()
-                        # start if Confirm detected with decent confidence
-                        if action == "START" and conf > 0.55:
-                            in_home = False
-                            player.start()
-                            snake = Snake(start_pos=(WIDTH//2, HEIGHT//2))
-                            controller = InputController(initial="RIGHT")
-                            food = spawn_food()
-                            game_over = False
-                    except Exception:
-                        # model inference may error — keep home running
-                        pass
-            home.draw(last_gesture, last_conf)
-            pygame.display.flip()
-            continue
 
-        # In-game: sample gesture periodically to control snake
-        if time.time() - last_gesture_time > gesture_interval:
-            ret, frame = cap.read()
-            if ret:
-                try:
-                    action, conf = classifier.predict(frame)
-                    last_gesture = action
-                    last_conf = conf
-                    last_gesture_time = time.time()
-                    # only submit movement gestures
-                    if action in ("UP", "DOWN", "LEFT", "RIGHT") and conf > 0.25:
-                        controller.submit(action)
-                except Exception:
-                    pass
+        # In-game: pick up the worker's latest gesture (never blocks on the camera)
+        sample = gestures.latest()
+        if sample.timestamp > last_gesture_time:
+            last_gesture = sample.action
+            last_conf = sample.conf
+            last_gesture_time = sample.timestamp
+            # only submit movement gestures
+            if sample.action in ("UP", "DOWN", "LEFT", "RIGHT") and sample.conf > 0.25:
+                controller.submit(sample.action)
 
         # update direction from controller
         dir_string = controller.update()
@@ -166,7 +149,7 @@ def main():
         snake.update(dt=1.0)
 
         
-        hx, hy = snake.body_points[0]
+        hx, hy = snake.head
         if hx < 0 or hy < 0 or hx > WIDTH or hy > HEIGHT:
             game_over = True
             snake.alive = False
@@ -177,10 +160,10 @@ def main():
             snake.alive = False
 
         
-        if snake.collides_with_point(food, radius=14):
+        if "food" in snake.touching(pickups, radius=14):
             player.add_score(1)
             snake.grow(50)  # grow by some pixels
-            food = spawn_food()
+            food = place_food(pickups, food)
 
         
         bg.draw()
@@ -209,9 +192,9 @@ def main():
         if not running:
             break
 
-    # cleanup
+    # cleanup: the service stops its worker before releasing the camera
     home.close()
-    cap.release()
+    gestures.close()
     pygame.quit()
     sys.exit()
 
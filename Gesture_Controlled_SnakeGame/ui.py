@@ -1,31 +1,23 @@
 # ui.py
-# Updated HomeScreen.draw to display the processed (mirrored & cropped) preview used by MediaPipe
-# and to draw a bounding box around the detected hand when available (classifier.last_bbox).
+# HomeScreen.draw displays the processed (mirrored & cropped) preview used by MediaPipe
+# and draws a bounding box around the detected hand when available (sample.bbox).
 # Also draws small landmark dots if available.
+# Frames and predictions come from the shared GestureService (gesture/gesture_service.py).
 
 import pygame
 import cv2
 import numpy as np
 import time
-from gesture.gesture_model import GestureClassifier
 
 class HomeScreen:
-    def __init__(self, screen, cam_index=0, show_camera_preview=True):
+    def __init__(self, screen, gestures, show_camera_preview=True):
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.font = pygame.font.SysFont("arial", 36)
         self.small = pygame.font.SysFont("arial", 20)
         self.show_camera_preview = show_camera_preview
-        # Use DirectShow on Windows where available for more reliable capture
-        try:
-            self.cap = cv2.VideoCapture(cam_index, cv2.CAP_DSHOW)
-            if not self.cap.isOpened():
-                self.cap.release()
-                self.cap = cv2.VideoCapture(cam_index)
-        except Exception:
-            self.cap = cv2.VideoCapture(cam_index)
-        # classifier instance for preview/ready checks (target_size must match for consistent preview)
-        self.classifier = GestureClassifier(verbose=False, target_size=320)
+        # shared GestureService: owns the camera and the classifier, also used by gameplay
+        self.gestures = gestures
         self.ready = False
         self._last_ready_check_time = 0.0
         self.ready_check_interval = 0.12  # seconds between quick checks
@@ -34,17 +26,12 @@ class HomeScreen:
         self._last_conf = 0.0
 
     def close(self):
-        if self.cap:
-            self.cap.release()
-        if self.classifier:
-            try:
-                self.classifier.close()
-            except Exception:
-                pass
+        # the camera and classifier belong to the shared service, which main() closes
+        self.gestures = None
 
     def draw(self, last_gesture=None, confidence=0.0):
         """
-        Draw the Home screen. Uses classifier.last_frame_processed (mirrored & cropped)
+        Draw the Home screen. Uses the latest sample's processed frame (mirrored & cropped)
         as the preview image so the bbox coordinates align with the preview.
         """
         # Update quick readiness periodically
@@ -66,22 +53,9 @@ class HomeScreen:
         ready_surf = self.small.render(f"Gesture Ready: {ready_text}", True, ready_color)
         self.screen.blit(ready_surf, (40, self.height - 40))
 
-        # camera preview area (use classifier.last_frame_processed if available)
-        preview_img = None
-        if self.classifier and self.classifier.last_frame_processed is not None:
-            preview_img = self.classifier.last_frame_processed
-        elif self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                # Mirror so preview matches processed frame (but note processed frame is cropped/resized)
-                frame = cv2.flip(frame, 1)
-                # center-crop and resize to classifier target size for visual consistency
-                h, w = frame.shape[:2]
-                side = min(h, w)
-                sx = (w - side) // 2
-                sy = (h - side) // 2
-                square = frame[sy:sy+side, sx:sx+side]
-                preview_img = cv2.resize(square, (self.classifier.target_size, self.classifier.target_size), interpolation=cv2.INTER_AREA)
+        # camera preview area (the frame the worker last passed to MediaPipe)
+        sample = self.gestures.latest() if self.gestures else None
+        preview_img = sample.frame if sample else None
 
         if preview_img is not None and self.show_camera_preview:
             # Convert BGR -> RGB for pygame
@@ -97,12 +71,12 @@ class HomeScreen:
             py = 20
             self.screen.blit(preview_surf, (px, py))
 
-            # Draw bbox around detected hand if available (classifier.last_bbox is relative to processed frame)
-            if self.classifier.last_bbox:
-                bx, by, bw, bh = self.classifier.last_bbox
+            # Draw bbox around detected hand if available (sample.bbox is relative to processed frame)
+            if sample.bbox:
+                bx, by, bw, bh = sample.bbox
                 # scale bbox from processed size -> preview size
-                scale_x = preview_w / float(self.classifier.target_size)
-                scale_y = preview_h / float(self.classifier.target_size)
+                scale_x = preview_w / float(self.gestures.target_size)
+                scale_y = preview_h / float(self.gestures.target_size)
                 rx = int(px + bx * scale_x)
                 ry = int(py + by * scale_y)
                 rw = int(bw * scale_x)
@@ -111,8 +85,8 @@ class HomeScreen:
                 pygame.draw.rect(self.screen, (255, 200, 50), pygame.Rect(rx, ry, rw, rh), width=2)
 
             # Optionally draw small landmark dots
-            if self.classifier.last_landmarks:
-                for (lx, ly, lz) in self.classifier.last_landmarks:
+            if sample.landmarks:
+                for (lx, ly, lz) in sample.landmarks:
                     sx = int(px + lx * preview_w)
                     sy = int(py + ly * preview_h)
                     pygame.draw.circle(self.screen, (120, 200, 255), (sx, sy), 3)
@@ -124,22 +98,17 @@ class HomeScreen:
 
     def sample_gesture(self):
         """
-        Read one frame and return predicted label + confidence.
-        Ensures the classifier receives mirrored frames (predict flips internally).
+        Return the service's latest predicted label + confidence (never blocks).
         """
-        if not (self.cap and self.cap.isOpened()):
+        if not (self.gestures and self.gestures.is_opened()):
             return None, 0.0
-        ret, frame = self.cap.read()
-        if not ret:
-            return None, 0.0
-        try:
-            action, conf = self.classifier.predict(frame)
-            # store last seen for UI
-            self._last_gesture = action
-            self._last_conf = conf
-            return action, conf
-        except Exception:
+        sample = self.gestures.latest()
+        if not sample.timestamp:
             return None, 0.0
+        # store last seen for UI
+        self._last_gesture = sample.action
+        self._last_conf = sample.conf
+        return sample.action, sample.conf
 
     def update_ready_status(self, movement_conf_min=0.25):
         """
@@ -154,19 +123,24 @@ class HomeScreen:
 
     def check_gesture_ready(self, timeout=4.0, sample_interval=0.12, required_ratio=0.5, movement_conf_min=0.25):
         """
-        Blocking readiness check. Samples frames for up to `timeout` seconds.
+        Blocking readiness check. Samples predictions for up to `timeout` seconds.
         """
-        if not (self.cap and self.cap.isOpened()):
+        if not (self.gestures and self.gestures.is_opened()):
             return False
 
         end_time = time.time() + timeout
         total = 0
         good = 0
+        last_stamp = 0.0
         while time.time() < end_time:
-            action, conf = self.sample_gesture()
-            total += 1
-            if action in ("UP","DOWN","LEFT","RIGHT") and conf >= movement_conf_min:
-                good += 1
+            # only count predictions the worker has refreshed since the last look
+            stamp = self.gestures.latest().timestamp
+            if stamp != last_stamp:
+                last_stamp = stamp
+                action, conf = self.sample_gesture()
+                total += 1
+                if action in ("UP","DOWN","LEFT","RIGHT") and conf >= movement_conf_min:
+                    good += 1
             time.sleep(sample_interval)
 
         ratio = (good / total) if total > 0 else 0.0
@@ -0,0 +1,299 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from nqueens.bitmask_solver import (
+    SearchStats,
+    count_all_nqueens_bitmask,
+    count_all_nqueens_memo,
+    count_all_nqueens_symmetric,
+    solve_all_nqueens_bitmask,
+    solve_unique_nqueens_bitmask,
+)
+from nqueens.local_search import solve_iterative_optimized
+from nqueens.sweep import global_sweep_elimination
+
+
+def _timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+def bench_parallel(ns, workers, split_depth=2):
+    """Time the serial and process-pool solvers for every N and print the speedup."""
+    print(f"workers={workers} split_depth={split_depth}")
+    print(f"{'N':>3} {'solutions':>10} {'serial s':>10} {'parallel s':>11} {'speedup':>8}")
+    for n in ns:
+        serial, t_serial = _timed(solve_all_nqueens_bitmask, n)
+        parallel, t_parallel = _timed(
+            solve_all_nqueens_bitmask, n, workers=workers, split_depth=split_depth
+        )
+        if parallel != serial:
+            raise AssertionError(f"parallel result differs from serial for N={n}")
+        print(f"{n:>3} {len(serial):>10} {t_serial:>10.3f} {t_parallel:>11.3f} "
+              f"{t_serial / t_parallel:>7.2f}x")
+
+
+def count_nodes(n):
+    """Number of queens the full DFS places for an N x N board."""
+    mask = (1 << n) - 1
+    stack = [(0, 0, 0, 0)]
+    nodes = 0
+    while stack:
+        row, cols, ld, rd = stack.pop()
+        if row == n:
+            continue
+        avail = mask & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            nodes += 1
+            stack.append((row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1))
+    return nodes
+
+
+def bench_engines(ns, repeats=3):
+    """Report nodes/sec of the recursive and iterative DFS engines (best of `repeats`)."""
+    print(f"{'N':>3} {'nodes':>11} {'recursive n/s':>14} {'iterative n/s':>14} {'ratio':>6}")
+    for n in ns:
+        nodes = count_nodes(n)
+        rates = {}
+        reference = None
+        for engine in ("recursive", "iterative"):
+            best = float("inf")
+            for _ in range(repeats):
+                sols, elapsed = _timed(solve_all_nqueens_bitmask, n, engine=engine)
+                best = min(best, elapsed)
+            if reference is None:
+                reference = sols
+            elif sols != reference:
+                raise AssertionError(f"{engine} engine differs from recursive for N={n}")
+            rates[engine] = nodes / best
+        print(f"{n:>3} {nodes:>11} {rates['recursive']:>14,.0f} {rates['iterative']:>14,.0f} "
+              f"{rates['iterative'] / rates['recursive']:>5.2f}x")
+
+
+def bench_symmetry(ns):
+    """Compare full enumeration against the half-row symmetric count and unique set."""
+    print(f"{'N':>3} {'total':>10} {'unique':>8} {'full s':>9} {'sym count s':>12} {'unique s':>9}")
+    for n in ns:
+        full, t_full = _timed(solve_all_nqueens_bitmask, n)
+        total, t_count = _timed(count_all_nqueens_symmetric, n)
+        unique, t_unique = _timed(solve_unique_nqueens_bitmask, n)
+        if total != len(full) or sum(size for _, size in unique) != total:
+            raise AssertionError(f"symmetric counts disagree with full enumeration for N={n}")
+        print(f"{n:>3} {total:>10} {len(unique):>8} {t_full:>9.3f} {t_count:>12.3f} {t_unique:>9.3f}")
+
+
+def bench_memo(ns, ks, max_entries):
+    """Compare plain counting with the lower-rows memo for each k, with hit rates."""
+    print(f"max_entries={max_entries}")
+    print(f"{'N':>3} {'k':>3} {'plain s':>9} {'memo s':>9} {'hit rate':>9} {'entries':>9}")
+    for n in ns:
+        plain, t_plain = _timed(count_all_nqueens_bitmask, n)
+        for k in ks:
+            stats = {}
+            memo, t_memo = _timed(count_all_nqueens_memo, n, k, max_entries, stats)
+            if memo != plain:
+                raise AssertionError(f"memo count differs for N={n}, k={k}")
+            print(f"{n:>3} {k:>3} {t_plain:>9.3f} {t_memo:>9.3f} "
+                  f"{stats['hit_rate']:>9.1%} {stats['entries']:>9}")
+
+
+def profile_search(ns):
+    """Print the per-row node, dead-end, branching and time profile of the DFS."""
+    for n in ns:
+        stats = SearchStats()
+        sols = solve_all_nqueens_bitmask(n, stats=stats)
+        print(f"N={n}: {len(sols)} solutions, {stats.total_nodes} nodes")
+        print(stats.format_table())
+        print()
+
+
+def bench_iterative(ns, restarts, seed=0):
+    """Report unique solutions found per second by the random-restart solver."""
+    print(f"restarts={restarts}")
+    print(f"{'N':>3} {'unique':>8} {'seconds':>9} {'unique/s':>10}")
+    for n in ns:
+        random.seed(seed)
+        sols, elapsed = _timed(solve_iterative_optimized, n, max_restarts=restarts)
+        print(f"{n:>3} {len(sols):>8} {elapsed:>9.3f} {len(sols) / elapsed:>10.1f}")
+
+
+def _run_bitmask(n):
+    # nodes come from count_nodes, outside the timed run
+    return len(solve_all_nqueens_bitmask(n)), None
+
+
+def _run_iterative(n, restarts=500):
+    stats = {}
+    sols = solve_iterative_optimized(n, max_restarts=restarts, stats=stats)
+    return len(sols), stats["placements"]
+
+
+def _run_sweep(n):
+    global_sweep_elimination(n)
+    return 1, n  # one step per row
+
+
+# name -> (runner returning (solutions, nodes or None), node counter run once
+# per N outside the timing when the runner returns None, default N range)
+SUITE = {
+    "bitmask": (_run_bitmask, count_nodes, list(range(6, 13))),
+    "iterative": (_run_iterative, None, [8, 12, 16, 20, 24]),
+    "sweep": (_run_sweep, None, [50, 100, 200, 300]),
+}
+
+RECORD_FIELDS = [
+    "solver", "n", "repeats", "wall_min_s", "wall_mean_s",
+    "solutions", "nodes", "solutions_per_s", "nodes_per_s", "peak_mem_bytes",
+]
+
+
+def run_suite(solvers, ns=None, repeats=3, seed=0):
+    """Benchmark each solver over its N range and return one record per (solver, N).
+
+    Nodes are DFS placements for the bitmask solver (counted once per N by
+    a separate search, so only the solver itself is timed), queens placed
+    across all restarts for the iterative solver and rows swept for the
+    sweep. Timing runs are untraced; peak memory comes from
+    one extra run under tracemalloc.
+    """
+    records = []
+    for name in solvers:
+        runner, node_counter, default_ns = SUITE[name]
+        for n in ns or default_ns:
+            times = []
+            for _ in range(repeats):
+                random.seed(seed)
+                (solutions, nodes), elapsed = _timed(runner, n)
+                times.append(elapsed)
+            if nodes is None:
+                nodes = node_counter(n)
+            random.seed(seed)
+            tracemalloc.start()
+            runner(n)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            best = min(times)
+            records.append({
+                "solver": name,
+                "n": n,
+                "repeats": repeats,
+                "wall_min_s": best,
+                "wall_mean_s": sum(times) / len(times),
+                "solutions": solutions,
+                "nodes": nodes,
+                "solutions_per_s": solutions / best if best else None,
+                "nodes_per_s": nodes / best if best else None,
+                "peak_mem_bytes": peak,
+            })
+            print(f"{name:>9} N={n:<4} {best:>9.4f} s  {solutions:>8} sols  "
+                  f"{nodes:>11} nodes  {peak / 2**20:>8.2f} MiB")
+    return records
+
+
+def write_results(records, json_path=None, csv_path=None):
+    if json_path:
+        payload = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "records": records,
+        }
+        with open(json_path, "w") as f:
+            json.dump(payload, f, indent=2)
+    if csv_path:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+
+
+def compare_results(records, baseline_path, tolerance=0.10):
+    """Print solvers/N whose best wall time regressed by more than `tolerance`.
+
+    Returns the number of regressions found.
+    """
+    with open(baseline_path) as f:
+        baseline = {(r["solver"], r["n"]): r for r in json.load(f)["records"]}
+    regressions = 0
+    for rec in records:
+        old = baseline.get((rec["solver"], rec["n"]))
+        if not old:
+            continue
+        ratio = rec["wall_min_s"] / old["wall_min_s"] if old["wall_min_s"] else 1.0
+        if ratio > 1 + tolerance:
+            regressions += 1
+            print(f"REGRESSION {rec['solver']} N={rec['n']}: "
+                  f"{old['wall_min_s']:.4f} s -> {rec['wall_min_s']:.4f} s ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N-Queens solver benchmarks")
+    sub = parser.add_subparsers(dest="suite", required=True)
+
+    p = sub.add_parser("parallel", help="serial vs process-pool bitmask solver")
+    p.add_argument("--n", type=int, nargs="+", default=list(range(8, 14)))
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--split-depth", type=int, default=2)
+
+    p = sub.add_parser("engines", help="nodes/sec of the recursive vs iterative DFS")
+    p.add_argument("--n", type=int, nargs="+", default=list(range(8, 16)))
+    p.add_argument("--repeats", type=int, default=3)
+
+    p = sub.add_parser("symmetry", help="half-row symmetric counting and unique solutions")
+    p.add_argument("--n", type=int, nargs="+", default=list(range(8, 13)))
+
+    p = sub.add_parser("memo", help="memoised lower-rows counting vs plain DFS")
+    p.add_argument("--n", type=int, nargs="+", default=list(range(9, 13)))
+    p.add_argument("--k", type=int, nargs="+", default=[2, 3, 4, 6])
+    p.add_argument("--max-entries", type=int, default=1 << 20)
+
+    p = sub.add_parser("profile", help="per-row DFS statistics")
+    p.add_argument("--n", type=int, nargs="+", default=[10])
+
+    p = sub.add_parser("iterative", help="unique solutions/sec of the random-restart solver")
+    p.add_argument("--n", type=int, nargs="+", default=[8, 10, 12, 16, 20])
+    p.add_argument("--restarts", type=int, default=3000)
+
+    p = sub.add_parser("suite", help="all solvers, machine-readable results")
+    p.add_argument("--solvers", nargs="+", choices=sorted(SUITE), default=sorted(SUITE))
+    p.add_argument("--n", type=int, nargs="+", help="override every solver's N range")
+    p.add_argument("--repeats", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--json", help="write results as JSON")
+    p.add_argument("--csv", help="write results as CSV")
+    p.add_argument("--compare", help="baseline JSON; exit 1 on wall-time regressions")
+    p.add_argument("--tolerance", type=float, default=0.10)
+
+    args = parser.parse_args()
+    if args.suite == "parallel":
+        bench_parallel(args.n, args.workers, args.split_depth)
+    elif args.suite == "engines":
+        bench_engines(args.n, args.repeats)
+    elif args.suite == "symmetry":
+        bench_symmetry(args.n)
+    elif args.suite == "memo":
+        bench_memo(args.n, args.k, args.max_entries)
+    elif args.suite == "profile":
+        profile_search(args.n)
+    elif args.suite == "iterative":
+        bench_iterative(args.n, args.restarts)
+    elif args.suite == "suite":
+        records = run_suite(args.solvers, args.n, args.repeats, args.seed)
+        write_results(records, args.json, args.csv)
+        if args.compare and compare_results(records, args.compare, args.tolerance):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# Put this directory on sys.path so `pytest` finds the nqueens package
+# whether it is run from here or from the repository root.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
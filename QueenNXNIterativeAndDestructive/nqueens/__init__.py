@@ -0,0 +1,63 @@
+"""Headless N-Queens solvers.
+
+Importing this package never loads tkinter or PIL; the viewer lives in
+`nqueens.chessboard_gui` and is only imported when asked for (see
+`nqueens.cli`).
+"""
+
+from .bitmask_solver import (
+    SearchStats,
+    allowed_rows,
+    classify_solution,
+    compact_solution,
+    count_all_nqueens_bitmask,
+    count_all_nqueens_memo,
+    count_all_nqueens_symmetric,
+    iter_nqueens_bitmask,
+    solution_cells,
+    solve_all_nqueens_bitmask,
+    solve_unique_nqueens_bitmask,
+    split_prefixes,
+    symmetries,
+)
+from .checkpoint import count_all_nqueens_resumable
+from .constructive import construct_nqueens
+from .export import export_images, render_board, render_sheet
+from .local_search import solve_iterative_optimized, solve_min_conflicts
+from .output import print_solutions_formatted
+from .solution_store import SolutionStore, solve_to_file, write_solutions
+from .sources import LazySolutions, solver_source
+from .sweep import global_sweep_elimination
+from .validate import validate_solution, validate_solutions_batch
+
+__all__ = [
+    "LazySolutions",
+    "SearchStats",
+    "SolutionStore",
+    "allowed_rows",
+    "classify_solution",
+    "compact_solution",
+    "construct_nqueens",
+    "count_all_nqueens_bitmask",
+    "count_all_nqueens_memo",
+    "count_all_nqueens_resumable",
+    "count_all_nqueens_symmetric",
+    "export_images",
+    "global_sweep_elimination",
+    "iter_nqueens_bitmask",
+    "print_solutions_formatted",
+    "render_board",
+    "render_sheet",
+    "solution_cells",
+    "solve_all_nqueens_bitmask",
+    "solve_iterative_optimized",
+    "solve_min_conflicts",
+    "solve_to_file",
+    "solve_unique_nqueens_bitmask",
+    "solver_source",
+    "split_prefixes",
+    "symmetries",
+    "validate_solution",
+    "validate_solutions_batch",
+    "write_solutions",
+]
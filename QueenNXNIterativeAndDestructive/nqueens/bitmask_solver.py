@@ -0,0 +1,580 @@
+import os
+import time
+from array import array
+from functools import lru_cache
+
+
+def _enumerate_subtree(N, row, cols, ld, rd, prefix, limit=None):
+    """Collect every completion of a partial board with the bitmask DFS.
+
+    `prefix` holds the columns already chosen for rows 0..row-1 and
+    `cols/ld/rd` are the matching attack masks. Solutions are returned in
+    the same order the full DFS would produce them.
+    """
+    mask = (1 << N) - 1
+    results = []
+    pos = list(prefix) + [0] * (N - row)
+
+    def dfs(row, cols, ld, rd):
+        if limit and len(results) >= limit:
+            return True
+        if row == N:
+            results.append([(r, pos[r]) for r in range(N)])
+            return False
+        avail = mask & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            col = bit.bit_length() - 1
+            pos[row] = col
+            if dfs(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1):
+                return True
+        return False
+
+    dfs(row, cols, ld, rd)
+    return results
+
+
+def _enumerate_subtree_iterative(N, row, cols, ld, rd, prefix, limit=None):
+    """Explicit-stack version of `_enumerate_subtree` with the same output.
+
+    Per-depth masks live in preallocated lists indexed by row, so there is
+    no Python call per node and no dependence on the recursion limit. The
+    chosen squares are kept as bits and only turned into column indices
+    when a solution is emitted.
+    """
+    mask = (1 << N) - 1
+    if row == N:
+        return [[(r, prefix[r]) for r in range(N)]]
+    results = []
+    append = results.append
+    bits = [1 << c for c in prefix] + [0] * (N - row)
+    cols_at = [0] * N
+    ld_at = [0] * N
+    rd_at = [0] * N
+    avail_at = [0] * N
+    base = row
+    last = N - 1
+    a = mask & ~(cols | ld | rd)
+    if row == last:
+        if a:
+            bits[last] = a
+            append([(r, b.bit_length() - 1) for r, b in enumerate(bits)])
+        return results
+    while True:
+        if a:
+            bit = a & -a
+            a -= bit
+            c = cols | bit
+            l = (ld | bit) << 1
+            r = (rd | bit) >> 1
+            if row == last - 1:
+                # the last row has at most one free square, so test it in place
+                leaf = mask & ~(c | l | r)
+                if leaf:
+                    bits[row] = bit
+                    bits[last] = leaf
+                    append([(i, b.bit_length() - 1) for i, b in enumerate(bits)])
+                    if limit and len(results) >= limit:
+                        break
+                continue
+            bits[row] = bit
+            cols_at[row] = cols
+            ld_at[row] = ld
+            rd_at[row] = rd
+            avail_at[row] = a
+            cols, ld, rd = c, l, r
+            row += 1
+            a = mask & ~(c | l | r)
+        else:
+            row -= 1
+            if row < base:
+                break
+            a = avail_at[row]
+            cols = cols_at[row]
+            ld = ld_at[row]
+            rd = rd_at[row]
+    return results
+
+
+class SearchStats:
+    """Per-depth statistics of one bitmask DFS run.
+
+    Index `row` of each list describes the search nodes whose next queen
+    goes in that row:
+
+    * `nodes[row]`      nodes expanded (row == N counts complete boards)
+    * `dead_ends[row]`  expanded nodes with no free square left
+    * `time[row]`       seconds spent in those nodes, excluding their children
+    """
+
+    def __init__(self, N=0):
+        self.reset(N)
+
+    def reset(self, N):
+        self.N = N
+        self.nodes = [0] * (N + 1)
+        self.dead_ends = [0] * (N + 1)
+        self.time = [0.0] * (N + 1)
+
+    @property
+    def branching(self):
+        """Average number of children per expanded node, for each row."""
+        return [
+            self.nodes[r + 1] / self.nodes[r] if self.nodes[r] else 0.0
+            for r in range(self.N)
+        ]
+
+    @property
+    def total_nodes(self):
+        return sum(self.nodes)
+
+    def as_dict(self):
+        return {
+            "N": self.N,
+            "nodes": list(self.nodes),
+            "dead_ends": list(self.dead_ends),
+            "branching": self.branching,
+            "time": list(self.time),
+        }
+
+    def format_table(self):
+        lines = [f"{'row':>3} {'nodes':>11} {'dead ends':>11} {'branching':>9} {'self s':>9}"]
+        branching = self.branching + [0.0]
+        for r in range(self.N + 1):
+            lines.append(f"{r:>3} {self.nodes[r]:>11} {self.dead_ends[r]:>11} "
+                         f"{branching[r]:>9.3f} {self.time[r]:>9.4f}")
+        return "\n".join(lines)
+
+
+def _enumerate_instrumented(N, limit, stats):
+    """Recursive DFS that also fills a `SearchStats`; same output as the engines."""
+    mask = (1 << N) - 1
+    results = []
+    pos = [0] * N
+    stats.reset(N)
+    nodes = stats.nodes
+    dead_ends = stats.dead_ends
+    spent = stats.time
+    clock = time.perf_counter
+
+    def dfs(row, cols, ld, rd):
+        if limit and len(results) >= limit:
+            return True
+        start = clock()
+        nodes[row] += 1
+        if row == N:
+            results.append([(r, pos[r]) for r in range(N)])
+            spent[row] += clock() - start
+            return False
+        avail = mask & ~(cols | ld | rd)
+        if not avail:
+            dead_ends[row] += 1
+        stop = False
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            pos[row] = bit.bit_length() - 1
+            child = clock()
+            stop = dfs(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+            start += clock() - child
+            if stop:
+                break
+        spent[row] += clock() - start
+        return stop
+
+    dfs(0, 0, 0, 0)
+    return results
+
+
+_ENGINES = {
+    "recursive": _enumerate_subtree,
+    "iterative": _enumerate_subtree_iterative,
+}
+
+
+def _count_subtree(N, row, cols, ld, rd):
+    """Count the completions of a partial board without building solutions."""
+    mask = (1 << N) - 1
+
+    def dfs(row, cols, ld, rd):
+        if row == N:
+            return 1
+        total = 0
+        avail = mask & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            total += dfs(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+        return total
+
+    return dfs(row, cols, ld, rd)
+
+
+def allowed_rows(N, fixed):
+    """Return, per row, the mask of squares compatible with pre-placed queens.
+
+    `fixed` is an iterable of (row, col) queens. A fixed row allows only
+    its own square; any other row excludes every square a fixed queen
+    attacks. Raises ValueError straight away if the fixed queens are off
+    the board, share a row, or attack each other.
+    """
+    mask = (1 << N) - 1
+    placed = {}
+    for r, c in fixed:
+        if not (0 <= r < N and 0 <= c < N):
+            raise ValueError(f"pre-placed queen ({r}, {c}) is off the {N}x{N} board")
+        if placed.get(r, c) != c:
+            raise ValueError(f"two queens pre-placed in row {r}")
+        placed[r] = c
+    queens = sorted(placed.items())
+    for i, (r1, c1) in enumerate(queens):
+        for r2, c2 in queens[i + 1:]:
+            if c1 == c2 or r2 - r1 == abs(c1 - c2):
+                raise ValueError(f"pre-placed queens ({r1}, {c1}) and ({r2}, {c2}) attack each other")
+    allowed = []
+    for r in range(N):
+        if r in placed:
+            allowed.append(1 << placed[r])
+            continue
+        blocked = 0
+        for r0, c0 in queens:
+            bit = 1 << c0
+            d = r - r0 if r > r0 else r0 - r
+            blocked |= bit | (bit << d) | (bit >> d)
+        allowed.append(mask & ~blocked)
+    return allowed
+
+
+def _count_allowed(N, allowed):
+    """Count completions when row r may only use the squares in `allowed[r]`."""
+    if not all(allowed):
+        return 0
+
+    def dfs(row, cols, ld, rd):
+        if row == N:
+            return 1
+        total = 0
+        avail = allowed[row] & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            total += dfs(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+        return total
+
+    return dfs(0, 0, 0, 0)
+
+
+def split_prefixes(N, depth):
+    """Return the search-tree roots after placing queens in the first `depth` rows.
+
+    Each entry is `(cols, ld, rd, prefix)`, listed in the order the serial
+    DFS visits them, so concatenating subtree results in this order gives
+    exactly the serial solution list.
+    """
+    mask = (1 << N) - 1
+    units = []
+
+    def walk(row, cols, ld, rd, prefix):
+        if row == depth:
+            units.append((cols, ld, rd, tuple(prefix)))
+            return
+        avail = mask & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            prefix.append(bit.bit_length() - 1)
+            walk(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1, prefix)
+            prefix.pop()
+
+    walk(0, 0, 0, 0, [])
+    return units
+
+
+def _solve_unit(task):
+    N, depth, (cols, ld, rd, prefix), limit, engine = task
+    return _ENGINES[engine](N, depth, cols, ld, rd, prefix, limit)
+
+
+def _count_unit(task):
+    N, depth, (cols, ld, rd, _prefix) = task
+    return _count_subtree(N, depth, cols, ld, rd)
+
+
+def process_pool(workers):
+    """Return a ProcessPoolExecutor; imported lazily as it costs ~30 ms to load."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _resolve_workers(workers):
+    if workers == 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _solve_parallel(N, limit, workers, split_depth, engine):
+    depth = min(split_depth, N)
+    tasks = [(N, depth, unit, limit, engine) for unit in split_prefixes(N, depth)]
+    results = []
+    with process_pool(workers) as pool:
+        # map() yields in submission order, which keeps the merge deterministic.
+        for part in pool.map(_solve_unit, tasks):
+            results.extend(part)
+            if limit and len(results) >= limit:
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
+    return results[:limit] if limit else results
+
+
+def solve_all_nqueens_bitmask(N, limit=None, workers=1, split_depth=2, engine="iterative",
+                              stats=None, fixed=None):
+    """Enumerate all N-Queens solutions using a compact bitmask DFS.
+
+    Returns a list of solutions; each solution is a list of (row, col) pairs.
+    Set `limit` to stop early (None => unlimited).
+
+    With `workers` > 1 the tree is split after the first `split_depth` rows
+    and the subtrees are solved in a process pool (`workers=0` uses every
+    core). The merged list is identical to the serial result.
+
+    `engine` picks the DFS implementation: "iterative" (explicit stack, no
+    recursion limit) or "recursive" (the original closure). Both return
+    the same solutions in the same order.
+
+    Pass a `SearchStats` as `stats` to record per-row nodes, dead ends,
+    branching and time. This runs a separate, serial instrumented search,
+    so the normal engines carry no bookkeeping when `stats` is None.
+
+    `fixed` is a set of pre-placed (row, col) queens; only completions
+    that keep them are searched (serially, see `iter_nqueens_bitmask`).
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"unknown engine {engine!r}; expected one of {sorted(_ENGINES)}")
+    if fixed:
+        return list(iter_nqueens_bitmask(N, limit, fixed=fixed))
+    if stats is not None:
+        return _enumerate_instrumented(N, limit, stats)
+    workers = _resolve_workers(workers)
+    if workers > 1 and N > 1:
+        return _solve_parallel(N, limit, workers, split_depth, engine)
+    return _ENGINES[engine](N, 0, 0, 0, 0, (), limit)
+
+
+def count_all_nqueens_bitmask(N, workers=1, split_depth=2, fixed=None):
+    """Count N-Queens solutions without materialising any of them.
+
+    `workers` and `split_depth` behave as in `solve_all_nqueens_bitmask`;
+    the per-subtree counts are summed. With `fixed` pre-placed queens only
+    their completions are counted, serially.
+    """
+    if fixed:
+        return _count_allowed(N, allowed_rows(N, fixed))
+    workers = _resolve_workers(workers)
+    if workers > 1 and N > 1:
+        depth = min(split_depth, N)
+        tasks = [(N, depth, unit) for unit in split_prefixes(N, depth)]
+        with process_pool(workers) as pool:
+            return sum(pool.map(_count_unit, tasks))
+    return _count_subtree(N, 0, 0, 0, 0)
+
+
+def count_all_nqueens_memo(N, k=3, max_entries=1 << 20, stats=None):
+    """Count N-Queens solutions, memoising completion counts of the last `k` rows.
+
+    Once only `k` rows remain, their completions depend only on which
+    squares of those rows are still free, and many prefixes leave the same
+    ones. That tuple of free masks is the key of an LRU cache of at most
+    `max_entries` states (None => unbounded); only these boundary states
+    are looked up, and a miss is counted by the plain DFS. A row with no
+    free square returns 0 without a lookup.
+
+    Building the key costs about as much as counting the few rows it
+    saves, so under CPython this is not faster than
+    `count_all_nqueens_bitmask`; it is kept for the cache statistics and
+    as the memoised baseline. If a `stats` dict is passed it receives the cache hits, misses,
+    hit_rate and final number of entries. The count equals the plain DFS.
+    """
+    mask = (1 << N) - 1
+    memo_from = max(N - k, 0)
+    depths = range(N - memo_from)
+
+    @lru_cache(maxsize=max_entries)
+    def tail(free):
+        return _count_allowed(len(free), free)
+
+    def dfs(row, cols, ld, rd):
+        if row == memo_from:
+            # the last rows only see the squares the queens above leave free,
+            # so boards with the same free squares share one cache entry
+            free = tuple([mask & ~(cols | (ld << d) | (rd >> d)) for d in depths])
+            return tail(free) if all(free) else 0
+        total = 0
+        avail = mask & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail -= bit
+            total += dfs(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+        return total
+
+    count = dfs(0, 0, 0, 0)
+    if stats is not None:
+        info = tail.cache_info()
+        lookups = info.hits + info.misses
+        stats.update(
+            hits=info.hits,
+            misses=info.misses,
+            hit_rate=info.hits / lookups if lookups else 0.0,
+            entries=info.currsize,
+        )
+    return count
+
+
+def compact_solution(cols):
+    """Pack a column sequence into bytes (or a uint16 array when N > 255)."""
+    return bytes(cols) if len(cols) <= 256 else array("H", cols)
+
+
+def solution_cells(sol):
+    """Return a solution as (row, col) pairs, accepting the compact form too."""
+    if isinstance(sol, (bytes, bytearray, array)):
+        return list(enumerate(sol))
+    return sol
+
+
+def iter_nqueens_bitmask(N, limit=None, compact=False, fixed=None):
+    """Yield N-Queens solutions one at a time, in the same order as the solver.
+
+    By default each solution is a list of (row, col) pairs. With
+    `compact=True` it is the column index of each row packed by
+    `compact_solution`, which is far cheaper to keep around in bulk.
+    The search keeps its own stack, so nothing but the current board is
+    held in memory between yields.
+
+    `fixed` pre-places (row, col) queens: their rows are pinned and every
+    square they attack is removed from the other rows before the search.
+    Conflicting fixed queens raise ValueError when the generator is
+    created, not on first use.
+    """
+    allowed = allowed_rows(N, fixed) if fixed else [(1 << N) - 1] * N
+    return _iter_allowed(N, allowed, limit, compact)
+
+
+def _iter_allowed(N, allowed, limit, compact):
+    if N == 0:
+        yield compact_solution([]) if compact else []
+        return
+    if not all(allowed):
+        return
+    pos = [0] * N
+    cols = [0] * N
+    ld = [0] * N
+    rd = [0] * N
+    avail = [0] * N
+    avail[0] = allowed[0]
+    emitted = 0
+    row = 0
+    last = N - 1
+    while row >= 0:
+        a = avail[row]
+        if not a:
+            row -= 1
+            continue
+        bit = a & -a
+        avail[row] = a - bit
+        pos[row] = bit.bit_length() - 1
+        if row == last:
+            yield compact_solution(pos) if compact else [(r, pos[r]) for r in range(N)]
+            emitted += 1
+            if limit and emitted >= limit:
+                return
+            continue
+        c = cols[row] | bit
+        l = (ld[row] | bit) << 1
+        r = (rd[row] | bit) >> 1
+        row += 1
+        cols[row] = c
+        ld[row] = l
+        rd[row] = r
+        avail[row] = allowed[row] & ~(c | l | r)
+
+
+def symmetries(cols):
+    """Return the 8 images of a solution under the D4 group of the board.
+
+    `cols` is a sequence where `cols[r]` is the queen's column in row r.
+    The images are column tuples in the order: identity, rot90, rot180,
+    rot270, mirror, flip, transpose, anti-transpose.
+    """
+    n = len(cols)
+    last = n - 1
+    rot90 = [0] * n
+    rot270 = [0] * n
+    transpose = [0] * n
+    anti = [0] * n
+    for r, c in enumerate(cols):
+        rot90[c] = last - r
+        rot270[last - c] = r
+        transpose[c] = r
+        anti[last - c] = last - r
+    return [
+        tuple(cols),
+        tuple(rot90),
+        tuple(last - c for c in reversed(cols)),
+        tuple(rot270),
+        tuple(last - c for c in cols),
+        tuple(reversed(cols)),
+        tuple(transpose),
+        tuple(anti),
+    ]
+
+
+def classify_solution(cols):
+    """Return the size of the solution's D4 orbit (1, 2, 4 or 8)."""
+    return len(set(symmetries(cols)))
+
+
+def count_all_nqueens_symmetric(N):
+    """Count all N-Queens solutions while searching only half of the first row.
+
+    Mirroring the board swaps the left and right halves of row 0, so those
+    subtrees are counted once and doubled; for odd N the middle column is
+    its own mirror image and is searched separately. The empty board
+    counts as one solution, as in `count_all_nqueens_bitmask`.
+    """
+    if N == 0:
+        return 1
+    total = 0
+    for col in range(N // 2):
+        bit = 1 << col
+        total += _count_subtree(N, 1, bit, bit << 1, bit >> 1)
+    total *= 2
+    if N % 2:
+        bit = 1 << (N // 2)
+        total += _count_subtree(N, 1, bit, bit << 1, bit >> 1)
+    return total
+
+
+def solve_unique_nqueens_bitmask(N):
+    """Enumerate the fundamental N-Queens solutions (unique up to rotation/reflection).
+
+    Only the left half of row 0 (plus the middle column for odd N) is
+    searched. Every class has a member there, and a solution is kept only
+    when it is the lexicographically smallest image of its class.
+
+    Returns a list of `(solution, orbit_size)` pairs; each solution is a
+    list of (row, col) pairs and `orbit_size` is how many of the full
+    solutions it stands for, so the sizes add up to the total count.
+    """
+    if N == 0:
+        return [([], 1)]
+    fundamental = []
+    for col in range((N + 1) // 2):
+        bit = 1 << col
+        for sol in _enumerate_subtree(N, 1, bit, bit << 1, bit >> 1, (col,)):
+            cols = tuple(c for _, c in sol)
+            images = symmetries(cols)
+            if cols == min(images):
+                fundamental.append((sol, len(set(images))))
+    return fundamental
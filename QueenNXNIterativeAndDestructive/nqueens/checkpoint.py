@@ -0,0 +1,80 @@
+"""Resumable solution counting for long runs.
+
+The search tree is cut into work units, one per placement of the first
+`split_depth` queens (see `split_prefixes`). The count of each finished
+unit is written to a JSON checkpoint, so a restarted run with the same
+checkpoint path only solves the units that are still missing.
+
+From the shell: ``python -m nqueens N --checkpoint FILE``.
+"""
+
+import json
+import os
+
+from .bitmask_solver import _count_unit, _resolve_workers, process_pool, split_prefixes
+
+
+def load_checkpoint(path, N, split_depth):
+    """Return `{unit_index: count}` from `path`, or {} if it does not exist yet."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        state = json.load(f)
+    if state["N"] != N or state["split_depth"] != split_depth:
+        raise ValueError(
+            f"{path} belongs to N={state['N']}, split_depth={state['split_depth']}; "
+            f"refusing to resume N={N}, split_depth={split_depth}"
+        )
+    return {int(k): v for k, v in state["done"].items()}
+
+
+def save_checkpoint(path, N, split_depth, units, done):
+    """Atomically write the finished unit counts to `path`."""
+    state = {
+        "N": N,
+        "split_depth": split_depth,
+        "units": units,
+        "done": {str(k): v for k, v in sorted(done.items())},
+        "partial_count": sum(done.values()),
+    }
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def count_all_nqueens_resumable(N, path, split_depth=3, workers=1, progress=None):
+    """Count N-Queens solutions, checkpointing every finished work unit to `path`.
+
+    Units already recorded in the checkpoint are skipped, so an interrupted
+    run picks up where it stopped. `workers` behaves as in
+    `count_all_nqueens_bitmask`. `progress`, if given, is called as
+    `progress(done_units, total_units)` after each unit.
+    """
+    depth = min(split_depth, N)
+    units = split_prefixes(N, depth)
+    done = load_checkpoint(path, N, depth)
+    todo = [i for i in range(len(units)) if i not in done]
+
+    def record(i, count):
+        done[i] = count
+        save_checkpoint(path, N, depth, len(units), done)
+        if progress:
+            progress(len(done), len(units))
+
+    workers = _resolve_workers(workers)
+    if workers > 1:
+        from concurrent.futures import as_completed
+
+        with process_pool(workers) as pool:
+            futures = {pool.submit(_count_unit, (N, depth, units[i])): i for i in todo}
+            for fut in as_completed(futures):
+                record(futures[fut], fut.result())
+    else:
+        for i in todo:
+            record(i, _count_unit((N, depth, units[i])))
+
+    if not units:
+        save_checkpoint(path, N, depth, 0, done)
+    return sum(done.values())
+
@@ -0,0 +1,221 @@
+# chessboard_gui.py
+
+import tkinter as tk
+
+from .bitmask_solver import solution_cells
+from .sources import LazySolutions
+from .sprites import DARK, LIGHT, MIN_SPRITE_PX, sprite_file, sprite_image
+
+GLYPH_MIN_PX = 8  # smallest square that still fits a readable ♛ glyph
+
+class ChessBoardGUI:
+    def __init__(self, master, solutions, board_size, queen_img_path):
+        self.master = master
+        self.master.title("N-Queens Viewer")
+
+        # solutions: a list / SolutionStore, a LazySolutions (e.g. solver_source),
+        # or any iterable, which is wrapped so the window opens before it is consumed
+        if not isinstance(solutions, LazySolutions) and not hasattr(solutions, "__getitem__"):
+            solutions = LazySolutions(solutions)
+        self.solutions = solutions
+        self.lazy = isinstance(solutions, LazySolutions)
+        self.N = board_size
+        self.index = 0  
+
+        
+        self.board_px = 600
+        # past 600 queens the board grows instead of shrinking squares to nothing
+        self.square = max(self.board_px // self.N, 1)
+
+        # queen sprite from the cache; None means squares are too small and a glyph is drawn
+        self.queen_image = self.load_queen_image(queen_img_path)
+
+        # canvas for drawing board
+        self.canvas = tk.Canvas(
+            master,
+            width=self.square * self.N + 40,
+            height=self.square * self.N + 40
+        )
+        self.canvas.pack(pady=10)
+
+        
+        btn_frame = tk.Frame(master)
+        btn_frame.pack()
+
+        tk.Button(btn_frame, text="<< Prev", command=self.prev_solution).pack(side=tk.LEFT, padx=10)
+        tk.Button(btn_frame, text="Next >>", command=self.next_solution).pack(side=tk.LEFT, padx=10)
+
+        # jump to a solution number (1-based)
+        self.jump_entry = tk.Entry(btn_frame, width=8)
+        self.jump_entry.pack(side=tk.LEFT, padx=(20, 2))
+        self.jump_entry.bind("<Return>", lambda e: self.jump_from_entry())
+        tk.Button(btn_frame, text="Go", command=self.jump_from_entry).pack(side=tk.LEFT)
+
+        
+        master.bind("<Left>", lambda e: self.prev_solution())
+        master.bind("<Right>", lambda e: self.next_solution())
+
+        self.queen_items = []
+        self._redraw_pending = None
+        self._title_pending = None
+        self.draw_board()
+        self.draw_solution()
+
+
+    def load_queen_image(self, queen_img_path):
+        size = self.square - 10
+        if size < MIN_SPRITE_PX:
+            return None
+        path = sprite_file(queen_img_path, size)
+        if path is not None:
+            return tk.PhotoImage(master=self.master, file=path)
+        from PIL import ImageTk  # cache directory not writable
+
+        return ImageTk.PhotoImage(sprite_image(queen_img_path, size), master=self.master)
+
+
+    # Draw chessboard (once) — squares and labels never change between solutions
+
+    def draw_board(self):
+        if self.queen_image is None:
+            self.draw_board_image()
+            return
+        for r in range(self.N):
+            for c in range(self.N):
+                x1 = c * self.square + 20
+                y1 = r * self.square + 20
+                x2 = x1 + self.square
+                y2 = y1 + self.square
+
+                
+                color = LIGHT if (r + c) % 2 == 0 else DARK
+                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black", tags="board")
+
+        # Board labels (a,b,c...) & (1,2...)
+        for i in range(self.N):
+            # columns
+            col_label = chr(ord('A') + i)
+            self.canvas.create_text(20 + i*self.square + self.square/2,
+                                    10, text=col_label, font=("Arial", 12, "bold"), tags="board")
+            # rows
+            self.canvas.create_text(10,
+                                    20 + i*self.square + self.square/2,
+                                    text=str(self.N-i), font=("Arial", 12, "bold"), tags="board")
+
+    def draw_board_image(self):
+        # Large N: one pixel per square, zoomed up, instead of N*N rectangle items.
+        # Squares this small have no room for outlines or labels.
+        rows = [
+            "{" + " ".join(LIGHT if (r + c) % 2 == 0 else DARK for c in range(self.N)) + "}"
+            for r in range(2)
+        ]
+        img = tk.PhotoImage(master=self.master, width=self.N, height=self.N)
+        img.put(" ".join(rows[r % 2] for r in range(self.N)), to=(0, 0))
+        self.board_image = img.zoom(self.square) if self.square > 1 else img
+        self.canvas.create_image(20, 20, image=self.board_image, anchor="nw", tags="board")
+
+
+    # Place queens — reuses one image item per queen, so a switch is O(N) canvas calls
+
+    def draw_solution(self):
+        self._redraw_pending = None
+
+        if not self.lazy and not len(self.solutions):
+            self.master.title("N-Queens Viewer — no solutions")
+            return
+        sol = self.solutions.peek(self.index) if self.lazy else self.solutions[self.index]
+        if sol is None:
+            total = self.total()
+            if total is not None and self.index >= total:
+                # jumped past the end of a stream that turned out shorter
+                self.index = max(total - 1, 0)
+                if not total:
+                    self.master.title("N-Queens Viewer — no solutions")
+                    return
+            else:
+                self.master.title(f"N-Queens Viewer — loading solution {self.index+1}…")
+            self._redraw_pending = self.master.after(30, self.draw_solution)
+            return
+
+        # solutions may be (row, col) lists or compact column bytes
+        queens = solution_cells(sol)
+        items = self.queen_items
+        while len(items) < len(queens):
+            items.append(self.new_queen_item())
+        for item in items[len(queens):]:
+            self.canvas.delete(item)
+        del items[len(queens):]
+
+        half = self.square/2
+        boxed = self.queen_image is None and self.square < GLYPH_MIN_PX
+        for item, (x, y) in zip(items, queens):
+            cx = y * self.square + 20 + half
+            cy = x * self.square + 20 + half
+            if boxed:
+                self.canvas.coords(item, cx - half, cy - half, cx + half, cy + half)
+            else:
+                self.canvas.coords(item, cx, cy)
+
+        self.update_title()
+
+
+    def new_queen_item(self):
+        if self.queen_image is not None:
+            return self.canvas.create_image(0, 0, image=self.queen_image, tags="queen")
+        if self.square >= GLYPH_MIN_PX:
+            # negative font size is in pixels
+            return self.canvas.create_text(0, 0, text="\u265b", font=("Arial", -self.square),
+                                           fill="black", tags="queen")
+        # a few pixels per square: just fill the square
+        return self.canvas.create_rectangle(0, 0, 0, 0, fill="#B00020", outline="", tags="queen")
+
+    def total(self):
+        return self.solutions.total if self.lazy else len(self.solutions)
+
+    def update_title(self):
+        total = self.total()
+        shown = total if total is not None else f"{len(self.solutions)}+"
+        self.master.title(f"N-Queens Viewer — Solution {self.index+1}/{shown}")
+        if total is None and self._title_pending is None:
+            # keep the running count fresh until the total is known
+            self._title_pending = self.master.after(250, self._refresh_title)
+
+    def _refresh_title(self):
+        self._title_pending = None
+        if self._redraw_pending is None:
+            self.update_title()
+
+    def schedule_draw(self):
+        # Key repeat can outpace redraws; coalesce them into one per idle cycle
+        if self._redraw_pending is None:
+            self._redraw_pending = self.master.after_idle(self.draw_solution)
+
+    def next_solution(self):
+        total = self.total()
+        if total is None:
+            self.index += 1
+        elif total:
+            self.index = (self.index + 1) % total
+        self.schedule_draw()
+
+    def prev_solution(self):
+        total = self.total()
+        if self.index > 0:
+            self.index -= 1
+        elif total:
+            self.index = total - 1
+        self.schedule_draw()
+
+    def jump_to(self, index):
+        total = self.total()
+        if total is not None:
+            index = min(index, total - 1)
+        self.index = max(index, 0)
+        self.schedule_draw()
+
+    def jump_from_entry(self):
+        try:
+            number = int(self.jump_entry.get())
+        except ValueError:
+            return
+        self.jump_to(number - 1)
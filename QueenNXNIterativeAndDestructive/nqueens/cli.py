@@ -0,0 +1,242 @@
+"""Command line entry point: ``python -m nqueens N [options]``.
+
+Everything here is headless; tkinter and the viewer are imported only when
+``--view`` is given, and PIL only when images are rendered.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+
+from .bitmask_solver import (
+    count_all_nqueens_bitmask,
+    iter_nqueens_bitmask,
+    solve_all_nqueens_bitmask,
+    solve_unique_nqueens_bitmask,
+)
+from .checkpoint import count_all_nqueens_resumable
+from .constructive import construct_nqueens
+from .export import export_images
+from .local_search import solve_iterative_optimized, solve_min_conflicts
+from .output import print_solutions_formatted, write_solutions_json
+from .solution_store import SolutionStore, write_solutions
+from .sources import LazySolutions, solver_source
+from .sweep import global_sweep_elimination
+
+SOLVERS = ["bitmask", "unique", "constructive", "min-conflicts", "iterative", "sweep"]
+FORMATS = ["text", "json", "count", "nqs"]
+# solvers whose output is not a full placement (one queen per row), which a
+# solution file cannot hold
+PARTIAL_SOLVERS = {"sweep"}
+
+DEFAULT_QUEEN_IMG = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Queen_chess_piece.png"
+)
+
+
+def _parse_cell(text):
+    try:
+        r, c = text.split(",")
+        return int(r), int(c)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROW,COL, got {text!r}") from None
+
+
+def _parse_sheet(text):
+    try:
+        cols, rows = (int(n) for n in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COLSxROWS, got {text!r}") from None
+    if cols < 1 or rows < 1:
+        raise argparse.ArgumentTypeError(f"sheet needs at least one board, got {text!r}")
+    return cols, rows
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="nqueens", description="Solve and view N-Queens boards")
+    parser.add_argument("N", type=int, help="board size")
+    parser.add_argument("--solver", choices=SOLVERS, default="bitmask")
+    parser.add_argument("--limit", type=int, help="stop after this many solutions")
+    parser.add_argument("--format", choices=FORMATS, default="count",
+                        help="count (default), text, json, or nqs (binary, needs --output)")
+    parser.add_argument("--output", "-o", help="write to this file instead of stdout")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="process-pool size for the bitmask solver (0 = all cores)")
+    parser.add_argument("--fixed", type=_parse_cell, nargs="+", metavar="ROW,COL",
+                        help="pre-placed queens for the bitmask solver")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                        help="resumable bitmask count: finished work units are kept in FILE")
+    parser.add_argument("--seed", type=int, help="seed for the randomised solvers")
+    parser.add_argument("--restarts", type=int, default=800, help="iterative solver restarts")
+    parser.add_argument("--export", metavar="DIR", help="render the solutions as PNG images into DIR")
+    parser.add_argument("--sheet", type=_parse_sheet, metavar="COLSxROWS",
+                        help="with --export, tile boards into contact sheets")
+    parser.add_argument("--square", type=int, help="with --export, square size in pixels")
+    parser.add_argument("--input", metavar="FILE",
+                        help="read the solutions from an nqs file instead of solving")
+    parser.add_argument("--view", action="store_true", help="open the result in the Tk viewer")
+    parser.add_argument("--queen-img", default=DEFAULT_QUEEN_IMG)
+    return parser
+
+
+def solve(args, stream=False):
+    """Return an iterable of solutions for the parsed arguments.
+
+    With `--input` the solutions come from that file rather than a solver.
+    With `stream` the bitmask solver always runs as a serial generator,
+    leaving `--workers` to the consumer.
+    """
+    N = args.N
+    if args.input:
+        store = load(args)
+        return itertools.islice(store, args.limit) if args.limit else store
+    if args.solver != "bitmask" and args.fixed:
+        raise SystemExit("--fixed is only supported by the bitmask solver")
+    if args.solver == "bitmask":
+        if args.workers == 1 or args.fixed or stream:
+            return iter_nqueens_bitmask(N, args.limit, compact=True, fixed=args.fixed)
+        return solve_all_nqueens_bitmask(N, args.limit, workers=args.workers)
+    if args.solver == "unique":
+        sols = [sol for sol, _ in solve_unique_nqueens_bitmask(N)]
+    elif args.solver == "constructive":
+        sols = [construct_nqueens(N)]
+    elif args.solver == "min-conflicts":
+        sols = [solve_min_conflicts(N, seed=args.seed)]
+    elif args.solver == "iterative":
+        if args.seed is not None:
+            random.seed(args.seed)
+        sols = solve_iterative_optimized(N, max_restarts=args.restarts)
+    else:
+        sols = [global_sweep_elimination(N)]
+    sols = [sol for sol in sols if sol is not None]
+    return sols[:args.limit] if args.limit else sols
+
+
+def load(args):
+    """Open the solution file named by `--input`, checked against N."""
+    try:
+        store = SolutionStore(args.input)
+    except OSError as e:
+        raise SystemExit(f"nqueens: error: cannot open {args.input}: {e.strerror}") from None
+    if store.N != args.N:
+        raise SystemExit(f"{args.input} holds N={store.N} solutions, not N={args.N}")
+    return store
+
+
+def view(solutions, N, queen_img):
+    # Deferred so that nothing above pulls in tkinter or PIL.
+    import tkinter as tk
+
+    from .chessboard_gui import ChessBoardGUI
+
+    root = tk.Tk()
+    ChessBoardGUI(master=root, solutions=solutions, board_size=N, queen_img_path=queen_img)
+    root.mainloop()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        run(args)
+    except ValueError as e:
+        # e.g. pre-placed queens that attack each other
+        raise SystemExit(f"nqueens: error: {e}") from None
+
+
+def export(args):
+    # the solver streams serially; --workers goes to the renderer
+    solutions = solve(args, stream=True)
+    count = export_images(solutions, args.N, args.export, square=args.square, sheet=args.sheet,
+                          workers=args.workers, queen_img=args.queen_img)
+    print(f"wrote {count} images to {args.export}", file=sys.stderr)
+
+
+def run(args):
+    N = args.N
+
+    if args.export:
+        if args.format != "count" or args.output or args.view:
+            raise SystemExit("--export only writes images; it cannot be combined with "
+                             "--format, --output or --view")
+    elif args.sheet or args.square:
+        raise SystemExit("--sheet and --square only apply with --export")
+
+    if args.input and (args.solver != "bitmask" or args.fixed or args.checkpoint):
+        raise SystemExit("--input reads stored solutions; it cannot be combined with "
+                         "--solver, --fixed or --checkpoint")
+
+    if args.format == "nqs":
+        if not args.output:
+            raise SystemExit("--format nqs needs --output FILE")
+        if args.solver in PARTIAL_SOLVERS:
+            raise SystemExit(f"--format nqs stores full placements; the {args.solver} "
+                             "solver does not produce one")
+        if args.input and os.path.abspath(args.output) == os.path.abspath(args.input):
+            raise SystemExit("--output would overwrite the --input file")
+
+    if args.checkpoint:
+        if args.solver != "bitmask" or args.format != "count" or args.limit or args.fixed:
+            raise SystemExit("--checkpoint only applies to a plain bitmask count")
+
+        def progress(done, total):
+            print(f"\r{done}/{total} units", end="", file=sys.stderr, flush=True)
+
+        count = count_all_nqueens_resumable(N, args.checkpoint, workers=args.workers,
+                                            progress=progress)
+        print(file=sys.stderr)
+        print(count)
+        return
+
+    if args.export:
+        export(args)
+        return
+
+    if args.format == "count" and args.view:
+        # Nothing to write: let the viewer page through the solver lazily.
+        if args.input and not args.limit:
+            # a solution file is already indexed
+            source = load(args)
+        elif args.solver == "bitmask" and args.workers == 1 and not args.limit:
+            source = solver_source(N, fixed=args.fixed)
+        else:
+            source = LazySolutions(solve(args))
+        view(source, N, args.queen_img)
+        return
+
+    if args.format == "count":
+        if args.input:
+            count = len(load(args))
+            if args.limit:
+                count = min(count, args.limit)
+        elif args.solver == "bitmask" and not args.limit:
+            count = count_all_nqueens_bitmask(N, workers=args.workers, fixed=args.fixed)
+        else:
+            count = sum(1 for _ in solve(args))
+        print(count)
+        return
+
+    solutions = solve(args)
+    if args.format == "nqs":
+        count = write_solutions(args.output, N, solutions)
+        print(f"wrote {count} solutions to {args.output}", file=sys.stderr)
+        if args.view:
+            view(SolutionStore(args.output), N, args.queen_img)
+        return
+
+    if args.view:
+        solutions = list(solutions)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            write_solutions_json(solutions, out)
+        elif args.format == "text":
+            print_solutions_formatted(solutions, file=out)
+        else:
+            print(len(solutions), file=out)
+    finally:
+        if args.output:
+            out.close()
+    if args.view:
+        view(solutions, N, args.queen_img)
@@ -0,0 +1,25 @@
+def construct_nqueens(N):
+    """Return one N-Queens solution in O(N) time using the closed-form pattern.
+
+    Rows take the even columns (1-indexed) in increasing order followed by
+    the odd ones, with two fix-ups that make the pattern valid for every
+    N >= 4:
+
+    * N % 6 == 2: swap 1 and 3 among the odds and move 5 to the end.
+    * N % 6 == 3: move 2 to the end of the evens, and 1 and 3 to the end
+      of the odds.
+
+    Returns a list of (row, col) pairs like `solve_all_nqueens_bitmask`, or
+    None for N = 2 and 3, which have no solution.
+    """
+    if N in (2, 3):
+        return None
+    evens = list(range(2, N + 1, 2))
+    odds = list(range(1, N + 1, 2))
+    if N % 6 == 2:
+        odds = [3, 1] + odds[3:] + [5]
+    elif N % 6 == 3:
+        evens = evens[1:] + [2]
+        odds = odds[2:] + [1, 3]
+    return [(row, col - 1) for row, col in enumerate(evens + odds)]
+
@@ -0,0 +1,153 @@
+"""Headless PNG export of solutions, one image per board or tiled contact sheets.
+
+Boards are composed with PIL from a checkerboard tile rendered once per
+(N, square) and the cached queen sprite (see `nqueens.sprites`), so each
+board costs N pastes. Solutions are taken from the iterable a chunk at a
+time and each chunk is rendered and saved by a worker, so a stream from
+`iter_nqueens_bitmask` or a `SolutionStore` is never held in memory whole.
+PIL is imported on first use, keeping the package import headless.
+"""
+
+import itertools
+import os
+from collections import deque
+from functools import lru_cache
+
+from .bitmask_solver import _resolve_workers, process_pool, solution_cells
+from .sprites import DARK, LIGHT, MIN_SPRITE_PX, sprite_file, sprite_image
+
+BOARD_PX = 600  # default board size for single images, as in the viewer
+SHEET_BOARD_PX = 200  # default board size on contact sheets
+GAP = 8
+LABEL_PX = 14
+QUEEN_FILL = "#B00020"
+
+
+def default_square(N, sheet=False):
+    return max((SHEET_BOARD_PX if sheet else BOARD_PX) // N, 1)
+
+
+@lru_cache(maxsize=8)
+def board_tile(N, square):
+    """Return the empty N x N board with `square`-pixel squares as a PIL image."""
+    from PIL import Image, ImageColor
+
+    light, dark = ImageColor.getrgb(LIGHT), ImageColor.getrgb(DARK)
+    rows = [[light if (r + c) % 2 == 0 else dark for c in range(N)] for r in range(2)]
+    small = Image.new("RGB", (N, N))
+    small.putdata([px for r in range(N) for px in rows[r % 2]])
+    return small.resize((N * square, N * square), Image.NEAREST)
+
+
+def _sprite(queen_img, square):
+    size = square - 10
+    if queen_img is None or size < MIN_SPRITE_PX:
+        return None
+    return sprite_image(queen_img, size)
+
+
+def render_board(sol, N, square, queen_img=None):
+    """Render one solution as a PIL image.
+
+    With no `queen_img`, or squares too small for a sprite, queens are
+    drawn as filled squares.
+    """
+    board = board_tile(N, square).copy()
+    sprite = _sprite(queen_img, square)
+    if sprite is not None:
+        for r, c in solution_cells(sol):
+            board.paste(sprite, (c * square + 5, r * square + 5), sprite)
+    else:
+        from PIL import ImageDraw
+
+        draw = ImageDraw.Draw(board)
+        inset = square // 5
+        for r, c in solution_cells(sol):
+            x, y = c * square, r * square
+            draw.rectangle((x + inset, y + inset, x + square - 1 - inset, y + square - 1 - inset),
+                           fill=QUEEN_FILL)
+    return board
+
+
+def render_sheet(solutions, N, square, cols, queen_img=None, start=0):
+    """Tile `solutions` into one contact sheet, `cols` boards per row.
+
+    Each board is labelled with its 1-based solution number, counting from
+    `start`.
+    """
+    from PIL import Image, ImageDraw
+
+    solutions = list(solutions)
+    side = N * square
+    rows = -(-len(solutions) // cols)
+    cell_w, cell_h = side + GAP, side + LABEL_PX + GAP
+    sheet = Image.new("RGB", (cols * cell_w + GAP, rows * cell_h + GAP), "white")
+    draw = ImageDraw.Draw(sheet)
+    for i, sol in enumerate(solutions):
+        x = GAP + (i % cols) * cell_w
+        y = GAP + (i // cols) * cell_h
+        sheet.paste(render_board(sol, N, square, queen_img), (x, y))
+        draw.text((x, y + side + 1), f"#{start + i + 1}", fill="black")
+    return sheet
+
+
+def _render_chunk(task):
+    out_dir, N, square, queen_img, sheet, start, sols = task
+    if sheet:
+        name = os.path.join(out_dir, f"sheet-{start // (sheet[0] * sheet[1]) + 1:05d}.png")
+        render_sheet(sols, N, square, sheet[0], queen_img, start).save(name)
+        return 1
+    for i, sol in enumerate(sols):
+        name = os.path.join(out_dir, f"solution-{start + i + 1:06d}.png")
+        render_board(sol, N, square, queen_img).save(name)
+    return len(sols)
+
+
+def export_images(solutions, N, out_dir, square=None, sheet=None, workers=1, queen_img=None,
+                  chunk=64):
+    """Render `solutions` as PNG files in `out_dir` and return how many were written.
+
+    Each solution becomes ``solution-000001.png`` and so on, or with
+    `sheet=(cols, rows)` they are tiled ``cols * rows`` to a
+    ``sheet-00001.png``. `square` is the square size in pixels (default:
+    600 px boards, or 200 px on sheets). `queen_img` is the queen picture;
+    without it queens are drawn as filled squares.
+
+    With `workers` > 1 chunks of `chunk` solutions (or one sheet) are
+    rendered in a process pool (`workers=0` uses every core). At most two
+    chunks per worker are in flight, so memory does not grow with the
+    number of solutions.
+    """
+    if square is None:
+        square = default_square(N, sheet=bool(sheet))
+    os.makedirs(out_dir, exist_ok=True)
+    if queen_img is not None and square - 10 >= MIN_SPRITE_PX:
+        # warm the disk cache once so workers do not each resize the source
+        sprite_file(queen_img, square - 10)
+    per_task = sheet[0] * sheet[1] if sheet else chunk
+
+    solutions = iter(solutions)
+
+    def tasks():
+        for start in itertools.count(0, per_task):
+            sols = list(itertools.islice(solutions, per_task))
+            if not sols:
+                return
+            yield out_dir, N, square, queen_img, sheet, start, sols
+
+    workers = _resolve_workers(workers)
+    if workers == 1:
+        return sum(_render_chunk(task) for task in tasks())
+
+    written = 0
+    with process_pool(workers) as pool:
+        # Executor.map would drain the whole solution stream up front; keep a
+        # bounded window of futures instead.
+        pending = deque()
+        for task in tasks():
+            if len(pending) >= 2 * workers:
+                written += pending.popleft().result()
+            pending.append(pool.submit(_render_chunk, task))
+        while pending:
+            written += pending.popleft().result()
+    return written
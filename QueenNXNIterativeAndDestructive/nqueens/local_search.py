@@ -0,0 +1,196 @@
+import random
+
+
+def diag1(x, y, N):
+    return x - y + (N - 1)
+
+
+def diag2(x, y, N):
+    return x + y
+
+
+def solve_iterative_optimized(N, max_restarts=800, unique=True, stats=None):
+    """Collect N-Queens solutions by random greedy placement with restarts.
+
+    Each attempt keeps placing a queen on a uniformly random free cell
+    until the board is full or no free cell is left. Free cells are
+    tracked as one column bitset per row, and a placement only clears the
+    squares it attacks, so an attempt costs O(N^2) bit operations instead
+    of rescanning all N^2 cells per queen.
+
+    With `unique` (the default) a board reached by several attempts is
+    returned only once. Each solution is a list of (row, col) pairs in
+    placement order. If a `stats` dict is passed, the total number of
+    queens placed across all attempts is stored under "placements".
+    """
+    solutions = []
+    seen = set()
+    full = (1 << N) - 1
+    placements = 0
+
+    for attempt in range(max_restarts):
+
+        free = [full] * N        # free columns per row
+        counts = [N] * N         # popcount of free[row]
+        total = N * N
+        queens = []
+
+        for q in range(N):
+            if not total:
+                break
+
+            # k-th free cell in row-major order
+            k = random.randrange(total)
+            x = 0
+            while k >= counts[x]:
+                k -= counts[x]
+                x += 1
+            row_bits = free[x]
+            for _ in range(k):
+                row_bits &= row_bits - 1
+            bit = row_bits & -row_bits
+            queens.append((x, bit.bit_length() - 1))
+
+            # the row is taken; elsewhere clear the column and both diagonals
+            total -= counts[x]
+            free[x] = 0
+            counts[x] = 0
+            for r in range(N):
+                m = free[r]
+                if m:
+                    d = r - x if r > x else x - r
+                    left = m & ~(bit | (bit << d) | (bit >> d))
+                    if left != m:
+                        c = bin(left).count("1")
+                        total -= counts[r] - c
+                        counts[r] = c
+                        free[r] = left
+
+        placements += len(queens)
+        if len(queens) == N:
+            if unique:
+                key = tuple(y for _, y in sorted(queens))
+                if key in seen:
+                    continue
+                seen.add(key)
+            solutions.append(queens)
+
+    if stats is not None:
+        stats["placements"] = placements
+    return solutions
+
+
+def solve_min_conflicts(N, max_steps=None, seed=None, greedy_tail=64):
+    """Find one N-Queens solution with permutation-based min-conflicts search.
+
+    Queens are kept as a permutation (`cols[row]`), so rows and columns never
+    clash and only the two diagonal directions need conflict counters. Most
+    rows are placed greedily on a conflict-free column; the last
+    `greedy_tail` rows are placed at random and then repaired by swapping
+    the columns of two rows whenever that lowers the number of collisions.
+    A repair that stops making progress restarts from a fresh placement.
+
+    Runs in roughly linear time and handles N in the 10**5..10**6 range.
+    `max_steps` caps the total number of swap attempts (default
+    max(100 * N, 100000)) and `seed` makes a run reproducible.
+
+    Returns a list of (row, col) pairs, or None if no solution was reached
+    within `max_steps`.
+    """
+    if N in (2, 3):
+        return None
+    rng = random.Random(seed)
+    rand = rng.random
+    if max_steps is None:
+        max_steps = max(100 * N, 100000)
+    last = N - 1
+    patience = 20 * N + 200
+    steps = 0
+
+    while steps <= max_steps:
+        cols = list(range(N))
+        d1_count = [0] * (2 * N - 1)   # indexed by diag1(row, col, N) = row - col + N - 1
+        d2_count = [0] * (2 * N - 1)   # indexed by diag2(row, col, N) = row + col
+
+        # Greedy phase: pick a random unused column with both diagonals free.
+        free_rows = max(N - greedy_tail, 0)
+        for row in range(free_rows):
+            span = N - row
+            for _ in range(4 * N):
+                j = row + int(rand() * span)
+                col = cols[j]
+                if not d1_count[row - col + last] and not d2_count[row + col]:
+                    break
+            cols[row], cols[j] = col, cols[row]
+            d1_count[row - col + last] += 1
+            d2_count[row + col] += 1
+
+        # Random tail: fill the remaining rows with whatever columns are left.
+        for row in range(free_rows, N):
+            j = row + int(rand() * (N - row))
+            cols[row], cols[j] = cols[j], cols[row]
+            col = cols[row]
+            d1_count[row - col + last] += 1
+            d2_count[row + col] += 1
+
+        def conflicted(row):
+            col = cols[row]
+            return d1_count[row - col + last] > 1 or d2_count[row + col] > 1
+
+        collisions = (sum(c - 1 for c in d1_count if c > 1)
+                      + sum(c - 1 for c in d2_count if c > 1))
+        suspects = [row for row in range(N) if conflicted(row)]
+        idle = 0
+        while collisions and idle < patience and steps < max_steps:
+            moved = []
+            for i in suspects:
+                if not conflicted(i):
+                    continue
+                j = int(rand() * N)
+                steps += 1
+                idle += 1
+                if i == j:
+                    continue
+                ci, cj = cols[i], cols[j]
+                # Lift both queens off the board, then drop them in swapped columns.
+                delta = 0
+                for r, c in ((i, ci), (j, cj)):
+                    k = r - c + last
+                    d1_count[k] -= 1
+                    delta -= d1_count[k] > 0
+                    k = r + c
+                    d2_count[k] -= 1
+                    delta -= d2_count[k] > 0
+                for r, c in ((i, cj), (j, ci)):
+                    k = r - c + last
+                    delta += d1_count[k] > 0
+                    d1_count[k] += 1
+                    k = r + c
+                    delta += d2_count[k] > 0
+                    d2_count[k] += 1
+                if delta <= 0:
+                    cols[i], cols[j] = cj, ci
+                    collisions += delta
+                    moved.append(j)
+                    if delta:
+                        idle = 0
+                    if not collisions:
+                        break
+                else:
+                    for r, c in ((i, cj), (j, ci)):
+                        d1_count[r - c + last] -= 1
+                        d2_count[r + c] -= 1
+                    for r, c in ((i, ci), (j, cj)):
+                        d1_count[r - c + last] += 1
+                        d2_count[r + c] += 1
+            # Any new conflict involves a queen that just moved; fall back to a
+            # full scan if a diagonal is still crowded but no suspect is on it.
+            suspects = [row for row in dict.fromkeys(suspects + moved) if conflicted(row)]
+            if collisions and not suspects:
+                suspects = [row for row in range(N) if conflicted(row)]
+
+        if not collisions:
+            return [(row, cols[row]) for row in range(N)]
+        steps += 1
+
+    return None
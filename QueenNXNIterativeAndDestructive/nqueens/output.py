@@ -0,0 +1,21 @@
+import json
+
+from .bitmask_solver import solution_cells
+
+
+def print_solutions_formatted(solutions, file=None):
+    # `solutions` may be any iterable, e.g. iter_nqueens_bitmask(N, compact=True)
+    for idx, sol in enumerate(solutions, 1):
+        print(f"Soln {idx} :", file=file)
+        for qi, (x, y) in enumerate(solution_cells(sol), 1):
+            print(f"    Q{qi} → ({x}, {y})", file=file)
+        print(file=file)
+
+
+def write_solutions_json(solutions, fp):
+    """Stream solutions to `fp` as a JSON array of column lists, one per line."""
+    fp.write("[")
+    for idx, sol in enumerate(solutions):
+        cols = [c for _, c in sorted(solution_cells(sol))]
+        fp.write(("," if idx else "") + "\n  " + json.dumps(cols))
+    fp.write("\n]\n")
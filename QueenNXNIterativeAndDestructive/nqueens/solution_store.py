@@ -0,0 +1,113 @@
+"""Compact binary storage for N-Queens solutions.
+
+File layout (little endian):
+
+    magic  4 bytes   b"NQS1"
+    N      uint16    board size
+    count  uint64    number of solutions
+    body   count * N bytes, the column of the queen in each row
+
+Solutions are written as the solver streams them and read back through a
+memory map, so any solution can be fetched by index without loading the
+file.
+"""
+
+import mmap
+import struct
+
+from .bitmask_solver import iter_nqueens_bitmask, solution_cells
+
+MAGIC = b"NQS1"
+HEADER = struct.Struct("<4sHQ")
+
+
+def write_solutions(path, N, solutions):
+    """Stream `solutions` into a solution file and return how many were written.
+
+    Each solution may be a list of (row, col) pairs in any order or a
+    compact column sequence, and must place exactly one queen in every row.
+    Raises ValueError on the first solution that does not; the solutions
+    before it stay readable. The count in the header is patched in once
+    the stream ends.
+    """
+    if not 0 < N <= 256:
+        raise ValueError(f"solution files store one byte per row; N={N} is out of range")
+    rows = list(range(N))
+    count = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, N, 0))
+        try:
+            for sol in solutions:
+                if isinstance(sol, (bytes, bytearray)) and len(sol) == N and max(sol) < N:
+                    # compact form is already one column per row
+                    f.write(sol)
+                    count += 1
+                    continue
+                cells = sorted(solution_cells(sol))
+                if [r for r, _ in cells] != rows:
+                    raise ValueError(f"solution {count} does not place one queen in each of "
+                                     f"the {N} rows: {cells}")
+                cols = [c for _, c in cells]
+                if not all(0 <= c < N for c in cols):
+                    raise ValueError(f"solution {count} has a column outside 0..{N - 1}: {cells}")
+                f.write(bytes(cols))
+                count += 1
+        finally:
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, N, count))
+    return count
+
+
+def solve_to_file(path, N, limit=None):
+    """Run the bitmask solver and stream its solutions straight to `path`."""
+    return write_solutions(path, N, iter_nqueens_bitmask(N, limit=limit, compact=True))
+
+
+class SolutionStore:
+    """Read-only, memory-mapped view of a solution file.
+
+    Behaves like a sequence of compact solutions: `len(store)`, `store[i]`
+    (O(1), returns the N column bytes) and iteration, so it can be handed
+    to `ChessBoardGUI` or `print_solutions_formatted` directly.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a solution file")
+        if len(self._map) < HEADER.size or self._map[:4] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a solution file")
+        _, self.N, self.count = HEADER.unpack_from(self._map, 0)
+        if len(self._map) < HEADER.size + self.count * self.N:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("solution index out of range")
+        start = HEADER.size + index * self.N
+        return self._map[start:start + self.N]
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
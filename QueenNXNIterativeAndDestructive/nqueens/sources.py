@@ -0,0 +1,181 @@
+"""Lazy solution sources for the viewer.
+
+`ChessBoardGUI` only ever needs the solution on screen. A `LazySolutions`
+pulls solutions from any iterable on a background thread, never more than
+a small window past the index asked for, so the window can open before the
+solver has produced more than a handful of boards. Given a way to reopen
+the stream it also forgets solutions that fall out of the window, so
+memory stays bounded however far the user pages.
+"""
+
+import threading
+from collections import deque
+
+from .bitmask_solver import count_all_nqueens_bitmask, iter_nqueens_bitmask
+
+
+class LazySolutions:
+    """Index-addressable view of a solution stream, filled in the background.
+
+    Solutions are taken from `iterable` up to the requested index plus
+    `prefetch`. With `reopen`, a zero-argument callable returning a fresh
+    iterator over the same stream, only a window of `prefetch` solutions
+    either side of the last requested index is kept, and a jump back past
+    the window re-streams from the start and skips ahead. That costs time
+    proportional to the target index but no memory. Without `reopen` every
+    fetched solution is kept, so memory grows with the highest index
+    visited; use a `SolutionStore` for large stored runs.
+
+    `len()` is the number fetched so far and `total` stays None until the
+    stream ends or `set_total` is called.
+    """
+
+    def __init__(self, iterable, prefetch=32, reopen=None):
+        self.prefetch = prefetch
+        self.total = None
+        self._reopen = reopen
+        self._iter = iter(iterable)
+        self._items = deque()  # solutions _start .. _pos-1
+        self._start = 0
+        self._pos = 0  # index of the next solution the stream yields
+        self._fetched = 0  # highest _pos reached, for len()
+        self._wanted = prefetch
+        self._keep_from = 0  # solutions below this index may be dropped
+        self._seek = None  # index to re-stream from, set by a backward jump
+        self._exhausted = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+
+    def _fill(self):
+        while True:
+            with self._cond:
+                while (self._seek is None and not self._closed
+                       and (self._exhausted or self._pos >= self._wanted)):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                seek, self._seek = self._seek, None
+            if seek is not None:
+                self._restart(seek)
+                continue
+            try:
+                sol = next(self._iter)
+            except StopIteration:
+                with self._cond:
+                    self.total = self._pos
+                    self._exhausted = True
+                    self._cond.notify_all()
+                continue
+            with self._cond:
+                self._items.append(sol)
+                self._pos += 1
+                self._fetched = max(self._fetched, self._pos)
+                self._trim()
+                self._cond.notify_all()
+
+    def _restart(self, index):
+        it = iter(self._reopen())
+        pos = 0
+        for _ in range(index):
+            if self._seek is not None or self._closed:
+                return  # superseded by another jump
+            try:
+                next(it)
+            except StopIteration:
+                break
+            pos += 1
+        with self._cond:
+            self._iter = it
+            self._items.clear()
+            self._start = self._pos = pos
+            self._exhausted = False
+            self._cond.notify_all()
+
+    def _trim(self):
+        # caller holds the lock
+        if self._reopen is None:
+            return
+        while self._items and self._start < self._keep_from:
+            self._items.popleft()
+            self._start += 1
+
+    @property
+    def complete(self):
+        return self.total is not None
+
+    def __len__(self):
+        return self._fetched
+
+    def _get(self, index):
+        # caller holds the lock; None if `index` is not in the window
+        if self._seek is None and self._start <= index < self._pos:
+            return self._items[index - self._start]
+        return None
+
+    def request(self, index):
+        """Ask the background thread to fetch `index` and the prefetch window after it."""
+        with self._cond:
+            if self._reopen is not None:
+                self._keep_from = index - self.prefetch
+                if index < self._start and self._seek is None:
+                    self._seek = max(self._keep_from, 0)
+                    self._wanted = index + 1 + self.prefetch
+                self._trim()
+            if index + 1 + self.prefetch > self._wanted:
+                self._wanted = index + 1 + self.prefetch
+            self._cond.notify_all()
+
+    def peek(self, index):
+        """Return solution `index` if it has been fetched, else request it and return None."""
+        with self._cond:
+            sol = self._get(index)
+        if sol is None or index + self.prefetch >= self._wanted:
+            self.request(index)
+        return sol
+
+    def __getitem__(self, index):
+        """Blocking lookup; raises IndexError past the end of the stream."""
+        self.request(index)
+        with self._cond:
+            while True:
+                sol = self._get(index)
+                if sol is not None:
+                    return sol
+                if self._closed or (self._exhausted and self._seek is None
+                                    and index >= self._pos):
+                    raise IndexError("solution index out of range")
+                if index < self._start and self._seek is None:
+                    # dropped by another request while we waited; ask again
+                    # (the condition's lock is re-entrant)
+                    self.request(index)
+                self._cond.wait()
+
+    def set_total(self, total):
+        """Record the final count once it is known from elsewhere (e.g. a count run)."""
+        if self.total is None:
+            self.total = total
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+def solver_source(N, prefetch=32, fixed=None, count=True):
+    """Page through the bitmask solver's solutions without enumerating them up front.
+
+    With `count` a second background thread runs the count-only solver, so
+    the total is known long before the stream reaches the last solution.
+    """
+    def stream():
+        return iter_nqueens_bitmask(N, compact=True, fixed=fixed)
+
+    source = LazySolutions(stream(), prefetch, reopen=stream)
+    if count:
+        def run_count():
+            source.set_total(count_all_nqueens_bitmask(N, fixed=fixed))
+
+        threading.Thread(target=run_count, daemon=True).start()
+    return source
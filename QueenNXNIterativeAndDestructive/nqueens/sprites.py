@@ -0,0 +1,76 @@
+"""Pre-scaled queen sprites, cached in memory and on disk, and the board colours.
+
+The source image is large, so opening and LANCZOS-resizing it dominates
+viewer startup. Each size is rendered once and saved as a small PNG under
+the cache directory (``$NQUEENS_CACHE_DIR`` or ``~/.cache/nqueens/sprites``);
+the file name carries the source's mtime, so editing the image invalidates
+it. Tk 8.6 reads the cached PNG directly, so a warm start never imports PIL.
+"""
+
+import os
+
+LIGHT, DARK = "#EEEED2", "#769656"
+
+# below this many pixels a sprite is unreadable; callers draw a glyph instead
+MIN_SPRITE_PX = 12
+
+_files = {}
+_images = {}
+
+
+def cache_dir():
+    return os.environ.get("NQUEENS_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "nqueens", "sprites"
+    )
+
+
+def _key(src, size):
+    src = os.path.abspath(src)
+    return src, size, os.stat(src).st_mtime_ns
+
+
+def _cache_path(key):
+    src, size, mtime = key
+    stem = os.path.splitext(os.path.basename(src))[0]
+    return os.path.join(cache_dir(), f"{stem}-{size}px-{mtime:x}.png")
+
+
+def sprite_image(src, size):
+    """Return `src` scaled to `size` x `size` as a PIL image (memoised)."""
+    key = _key(src, size)
+    img = _images.get(key)
+    if img is None:
+        from PIL import Image
+
+        path = _files.get(key) or _cache_path(key)
+        if os.path.exists(path):
+            img = Image.open(path)
+            img.load()
+        else:
+            with Image.open(src) as full:
+                img = full.convert("RGBA").resize((size, size), Image.LANCZOS)
+        _images[key] = img
+    return img
+
+
+def sprite_file(src, size):
+    """Return the path of a cached `size`-pixel PNG of `src`, rendering it on a miss.
+
+    Returns None if the cache directory is not writable.
+    """
+    key = _key(src, size)
+    path = _files.get(key)
+    if path is not None:
+        return path
+    path = _cache_path(key)
+    if not os.path.exists(path):
+        img = sprite_image(src, size)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            img.save(tmp, "PNG")
+            os.replace(tmp, path)
+        except OSError:
+            return None
+    _files[key] = path
+    return path
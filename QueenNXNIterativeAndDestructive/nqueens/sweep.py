@@ -0,0 +1,26 @@
+def global_sweep_elimination(n):
+    """Return positions of queens that survive the global sweep elimination.
+
+    The sweep visits cells in row-major order; a cell survives if no earlier
+    survivor attacks it, and every survivor wipes out its row, column and
+    both diagonals. So only the occupancy of columns and diagonals matters:
+    they are kept as bitsets that shift one step per row, like the bitmask
+    solver's `cols/ld/rd`, and each row's first free column is read off in
+    O(1) big-int operations instead of walking rays cell by cell. The
+    survivors are the same as the original ray walk's.
+    """
+    mask = (1 << n) - 1
+    cols = ld = rd = 0
+    survivors = []
+    for r in range(n):
+        avail = mask & ~(cols | ld | rd)
+        if avail:
+            bit = avail & -avail
+            survivors.append((r, bit.bit_length() - 1))
+            cols |= bit
+            ld |= bit
+            rd |= bit
+        ld = (ld << 1) & mask
+        rd >>= 1
+    return survivors
+
@@ -0,0 +1,75 @@
+"""Solution validators: one board at a time, or a whole batch with NumPy."""
+
+from .bitmask_solver import solution_cells
+
+
+def validate_solution(sol, N):
+    """Check that `sol` places N non-attacking queens on an N x N board.
+
+    Accepts the (row, col) list form or the compact column form, and does
+    the four uniqueness checks with set construction, O(N) overall.
+    """
+    cells = solution_cells(sol)
+    if len(cells) != N:
+        return False
+    rows = [r for r, _ in cells]
+    cols = [c for _, c in cells]
+    if min(rows + cols, default=0) < 0 or max(rows + cols, default=0) >= N:
+        return False
+    return (
+        len(set(rows)) == N
+        and len(set(cols)) == N
+        and len({r - c for r, c in cells}) == N
+        and len({r + c for r, c in cells}) == N
+    )
+
+
+def _batch_arrays(np, solutions, N):
+    """Return (rows, cols) integer arrays of shape (S, N) for any solution batch."""
+    if isinstance(solutions, np.ndarray):
+        cols = np.asarray(solutions, dtype=np.int64)
+        if cols.ndim != 2:
+            raise ValueError("expected a 2-D array of shape (solutions, N)")
+        if N is not None and cols.shape[1] != N:
+            raise ValueError(f"array rows have {cols.shape[1]} columns, expected N={N}")
+        rows = np.broadcast_to(np.arange(cols.shape[1]), cols.shape)
+        return rows, cols
+    solutions = list(solutions)
+    if N is None:
+        N = max((len(sol) for sol in solutions), default=0)
+    # (row, col) lists come from the solvers in any row order; compact
+    # solutions are implicitly ordered by row. Wrong-length entries are
+    # padded with -1 so they fail the range check.
+    pairs = np.full((len(solutions), N, 2), -1, dtype=np.int64)
+    for i, sol in enumerate(solutions):
+        cells = solution_cells(sol)
+        if len(cells) == N:
+            pairs[i] = cells
+    return pairs[:, :, 0], pairs[:, :, 1]
+
+
+def validate_solutions_batch(solutions, N=None):
+    """Validate many solutions at once and return a boolean mask of valid ones.
+
+    `solutions` is either a 2-D array of column indices (solutions x N,
+    entry [i, r] is the queen's column in row r) or a sequence in the formats the solvers return:
+    lists of (row, col) pairs, from `solve_all_nqueens_bitmask` and
+    `solve_iterative_optimized`, or compact column bytes. Rows, columns
+    and both diagonals are checked for uniqueness with sorted NumPy
+    arrays across the whole batch.
+    """
+    # imported here so the rest of the package loads without NumPy
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("validate_solutions_batch needs NumPy; use validate_solution instead") from None
+    rows, cols = _batch_arrays(np, solutions, N)
+    n = cols.shape[1]
+
+    def distinct(a):
+        a = np.sort(a, axis=1)
+        return (a[:, 1:] != a[:, :-1]).all(axis=1)
+
+    in_range = ((rows >= 0) & (rows < n) & (cols >= 0) & (cols < n)).all(axis=1)
+    return (in_range & distinct(rows) & distinct(cols)
+            & distinct(rows - cols) & distinct(rows + cols))
@@ -0,0 +1,65 @@
+import pytest
+
+from nqueens import (
+    count_all_nqueens_bitmask,
+    count_all_nqueens_memo,
+    count_all_nqueens_symmetric,
+    iter_nqueens_bitmask,
+    solve_all_nqueens_bitmask,
+    solve_unique_nqueens_bitmask,
+    validate_solution,
+)
+
+# OEIS A000170
+KNOWN_COUNTS = [1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+
+
+@pytest.mark.parametrize("N", range(1, 9))
+def test_engines_agree(N):
+    recursive = solve_all_nqueens_bitmask(N, engine="recursive")
+    iterative = solve_all_nqueens_bitmask(N, engine="iterative")
+    assert recursive == iterative
+    assert len(iterative) == KNOWN_COUNTS[N]
+    assert all(validate_solution(sol, N) for sol in iterative)
+    assert [list(enumerate(sol)) for sol in iter_nqueens_bitmask(N, compact=True)] == iterative
+
+
+@pytest.mark.parametrize("engine", ["recursive", "iterative"])
+def test_limit_keeps_dfs_order(engine):
+    full = solve_all_nqueens_bitmask(8, engine=engine)
+    assert solve_all_nqueens_bitmask(8, limit=5, engine=engine) == full[:5]
+    assert list(iter_nqueens_bitmask(8, limit=5)) == full[:5]
+
+
+def test_parallel_matches_serial():
+    serial = solve_all_nqueens_bitmask(8)
+    assert solve_all_nqueens_bitmask(8, workers=2) == serial
+    assert solve_all_nqueens_bitmask(8, workers=2, limit=7) == serial[:7]
+    assert count_all_nqueens_bitmask(9, workers=2) == KNOWN_COUNTS[9]
+
+
+@pytest.mark.parametrize("N", range(0, 11))
+def test_counting_paths_agree(N):
+    assert count_all_nqueens_bitmask(N) == KNOWN_COUNTS[N]
+    assert count_all_nqueens_symmetric(N) == KNOWN_COUNTS[N]
+    assert count_all_nqueens_memo(N) == KNOWN_COUNTS[N]
+    assert count_all_nqueens_memo(N, k=N, max_entries=16) == KNOWN_COUNTS[N]
+
+
+@pytest.mark.parametrize("fixed", [[(0, 0)], [(2, 5)], [(1, 3), (6, 1)], [(0, 2), (7, 3)]])
+def test_fixed_matches_filtered_enumeration(fixed):
+    expected = [sol for sol in solve_all_nqueens_bitmask(8) if set(fixed) <= set(sol)]
+    assert solve_all_nqueens_bitmask(8, fixed=fixed) == expected
+    assert count_all_nqueens_bitmask(8, fixed=fixed) == len(expected)
+
+
+def test_conflicting_fixed_queens_raise():
+    with pytest.raises(ValueError):
+        iter_nqueens_bitmask(8, fixed=[(0, 0), (3, 3)])
+    with pytest.raises(ValueError):
+        count_all_nqueens_bitmask(8, fixed=[(0, 0), (0, 1)])
+
+
+@pytest.mark.parametrize("N", range(0, 11))
+def test_unique_orbits_cover_all_solutions(N):
+    assert sum(orbit for _, orbit in solve_unique_nqueens_bitmask(N)) == KNOWN_COUNTS[N]
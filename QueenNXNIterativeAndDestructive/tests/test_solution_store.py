@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from nqueens import (
+    SolutionStore,
+    global_sweep_elimination,
+    iter_nqueens_bitmask,
+    solve_iterative_optimized,
+    validate_solution,
+    write_solutions,
+)
+
+
+def test_iterative_solutions_round_trip(tmp_path):
+    # the iterative solver returns (row, col) pairs in placement order, not row order
+    random.seed(1)
+    sols = solve_iterative_optimized(8)
+    path = tmp_path / "iterative.nqs"
+    assert write_solutions(path, 8, sols) == len(sols)
+    with SolutionStore(path) as store:
+        assert len(store) == len(sols)
+        for stored, sol in zip(store, sols):
+            assert validate_solution(stored, 8)
+            assert list(stored) == [c for _, c in sorted(sol)]
+
+
+def test_compact_solutions_round_trip(tmp_path):
+    sols = list(iter_nqueens_bitmask(6, compact=True))
+    path = tmp_path / "bitmask.nqs"
+    write_solutions(path, 6, sols)
+    with SolutionStore(path) as store:
+        assert list(store) == sols
+
+
+def test_partial_solution_is_rejected(tmp_path):
+    path = tmp_path / "sweep.nqs"
+    with pytest.raises(ValueError):
+        write_solutions(path, 8, [global_sweep_elimination(8)])
+    with SolutionStore(path) as store:
+        assert len(store) == 0
@@ -0,0 +1,25 @@
+import pytest
+
+from nqueens import global_sweep_elimination
+
+
+def ray_walk(n):
+    """The original sweep: every survivor clears its eight rays cell by cell."""
+    board = [[1] * n for _ in range(n)]
+    dirs = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+    for r in range(n):
+        for c in range(n):
+            if board[r][c] != 1:
+                continue
+            for dr, dc in dirs:
+                nr, nc = r + dr, c + dc
+                while 0 <= nr < n and 0 <= nc < n:
+                    board[nr][nc] = 0
+                    nr += dr
+                    nc += dc
+    return [(r, c) for r in range(n) for c in range(n) if board[r][c] == 1]
+
+
+@pytest.mark.parametrize("n", list(range(0, 40)) + [64, 101])
+def test_sweep_matches_ray_walk(n):
+    assert global_sweep_elimination(n) == ray_walk(n)
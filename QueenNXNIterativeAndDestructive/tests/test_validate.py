@@ -0,0 +1,38 @@
+import pytest
+
+from nqueens import (
+    construct_nqueens,
+    iter_nqueens_bitmask,
+    solve_all_nqueens_bitmask,
+    validate_solution,
+    validate_solutions_batch,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def test_batch_agrees_with_single_board_check():
+    sols = solve_all_nqueens_bitmask(6)
+    bad = [
+        [(0, 0), (1, 1), (2, 4), (3, 2), (4, 5), (5, 3)],  # shared diagonal
+        [(0, 1), (1, 3), (2, 5), (3, 0), (4, 2)],  # missing a queen
+        [(0, 1), (1, 3), (2, 5), (3, 0), (4, 2), (5, 6)],  # off the board
+    ]
+    batch = sols + bad
+    expected = [validate_solution(sol, 6) for sol in batch]
+    assert expected == [True] * len(sols) + [False] * len(bad)
+    assert validate_solutions_batch(batch, 6).tolist() == expected
+
+
+def test_batch_accepts_compact_forms():
+    compact = list(iter_nqueens_bitmask(8, compact=True))
+    assert validate_solutions_batch(compact).all()
+    cols = np.array([list(sol) for sol in compact])
+    assert validate_solutions_batch(cols, 8).all()
+    cols[0, 1] = cols[0, 0]
+    assert validate_solutions_batch(cols, 8).tolist() == [False] + [True] * (len(compact) - 1)
+
+
+@pytest.mark.parametrize("N", [1, 4, 5, 8, 9, 14, 15, 20, 100])
+def test_constructive_solutions_are_valid(N):
+    assert validate_solution(construct_nqueens(N), N)